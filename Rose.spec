@@ -310,7 +310,9 @@ hiddenimports = [
     # Native dialogs and settings (already covered by utils.integration and utils.system above)
     
     # Other dependencies
+    'orjson',
     'psutil',
+    'rapidfuzz',
     
     # Top-level modules
     'config',
@@ -5,6 +5,8 @@
 from typing import Literal, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config import (
     ANALYTICS_ENABLED,
@@ -32,6 +34,17 @@ class AnalyticsClient:
         self.server_url = server_url or ANALYTICS_SERVER_URL
         self.timeout = ANALYTICS_TIMEOUT_S if timeout is None else timeout
         self.enabled = ANALYTICS_ENABLED if enabled is None else enabled
+        # Reused across pings so back-to-back requests share one TLS connection.
+        # Only connection failures are retried; POSTs are never replayed after a read error.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=2,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            ),
+        )
 
     def send_ping(
         self,
@@ -52,7 +65,7 @@ class AnalyticsClient:
         request_timeout = self.timeout if timeout is None else timeout
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.server_url,
                 json=payload,
                 headers={
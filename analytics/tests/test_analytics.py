@@ -28,19 +28,17 @@ class InstallIdTests(unittest.TestCase):
 
 class AnalyticsClientTests(unittest.TestCase):
     @patch("analytics.core.analytics_client.get_install_id", return_value="00000000-0000-4000-8000-000000000000")
-    @patch("analytics.core.analytics_client.requests.post")
-    def test_ping_contains_pseudonymous_install_data(self, post, get_install_id):
+    def test_ping_contains_pseudonymous_install_data(self, get_install_id):
         response = Mock()
         response.status_code = 204
-        post.return_value = response
 
         client = AnalyticsClient(
             server_url="https://rosekeys.site/",
             timeout=2,
             enabled=True,
         )
-
-        self.assertTrue(client.send_ping("1.2.10"))
+        with patch.object(client._session, "post", return_value=response) as post:
+            self.assertTrue(client.send_ping("1.2.10"))
         post.assert_called_once()
         payload = post.call_args.kwargs["json"]
         self.assertEqual(payload, {
@@ -25,12 +25,16 @@ APP_USER_AGENT = f"Rose/{APP_VERSION}"  # User-Agent header for HTTP requests
 
 _CONFIG = configparser.ConfigParser()
 _CONFIG_MTIME: float = 0.0  # Last known modification time of config.ini
+_CONFIG_FILE_PATH: Optional[Path] = None  # Resolved once, the data dir never moves
 
 
 def get_config_file_path() -> Path:
-    config_dir = get_user_data_dir()
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir / "config.ini"
+    global _CONFIG_FILE_PATH
+    if _CONFIG_FILE_PATH is None:
+        config_dir = get_user_data_dir()
+        config_dir.mkdir(parents=True, exist_ok=True)
+        _CONFIG_FILE_PATH = config_dir / "config.ini"
+    return _CONFIG_FILE_PATH
 
 
 def _reload_config() -> None:
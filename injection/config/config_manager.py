@@ -6,20 +6,31 @@ Handles loading and saving League path configuration
 """
 
 import configparser
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from config import get_config_file_path
 from utils.core.logging import get_logger
+from utils.core.paths import file_exists
 
 log = get_logger()
 
+# Options read by load_league_path/load_client_path (ConfigParser lowercases keys)
+PATH_OPTIONS = frozenset({'leaguepath', 'clientpath'})
+
 
 class ConfigManager:
     """Manages League path configuration"""
     
     def __init__(self):
         self._config_path = None
+        # Parsed config.ini used for saves, reused until the file's mtime changes
+        self._parsed: Optional[configparser.ConfigParser] = None
+        self._parsed_mtime_ns: int = -1
+        # Path options used for loads, reused until the file's mtime changes
+        self._path_options: Optional[Dict[str, str]] = None
+        self._path_options_mtime_ns: int = -1
     
     def _get_config_path(self) -> Path:
         """Get the path to the config.ini file"""
@@ -27,115 +38,180 @@ class ConfigManager:
             self._config_path = get_config_file_path()
         return self._config_path
     
-    def load_league_path(self) -> Optional[str]:
-        """Load league path (League of Legends.exe directory) from config.ini file"""
+    def _get_parser(self) -> Optional[configparser.ConfigParser]:
+        """Get the parsed config.ini, re-reading it only when the file has changed.
+        Returns None if the config file does not exist."""
         config_path = self._get_config_path()
-        if not config_path.exists():
-            log.debug("Config file not found, will create one")
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except FileNotFoundError:
+            self._parsed = None
+            self._parsed_mtime_ns = -1
             return None
         
-        try:
+        if self._parsed is None or mtime_ns != self._parsed_mtime_ns:
             config = configparser.ConfigParser()
             config.read(config_path)
-            if 'General' in config and 'leaguePath' in config['General']:
-                league_path = config['General']['leaguePath']
-                log.debug(f"Loaded league path from config: {league_path}")
-                return league_path
-        except Exception as e:
-            log.warning(f"Failed to read config file: {e}")
-        
-        return None
+            self._parsed = config
+            self._parsed_mtime_ns = mtime_ns
+        return self._parsed
     
-    def load_client_path(self) -> Optional[str]:
-        """Load client path (LeagueClient.exe directory) from config.ini file"""
+    @staticmethod
+    def _scan_path_options(text: str) -> Dict[str, str]:
+        """Extract the path options from the General section of config.ini text.
+        A line scan is enough for these two keys, so loads skip ConfigParser.
+        Follows ConfigParser's default rules: comments are whole lines starting
+        with '#' or ';', keys are lowercased and split on the first '=' or ':',
+        and indented lines continue the previous value."""
+        options: Dict[str, list] = {}
+        in_general = False
+        current: Optional[list] = None  # Value lines of the path option being read
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
+            if line[:1] in ('#', ';'):
+                continue
+            if not line:
+                if current is not None:
+                    current.append('')  # Kept only if the value continues
+                continue
+            if raw_line[0].isspace():
+                if current is not None:
+                    current.append(line)
+                continue
+            current = None
+            if line[0] == '[' and line[-1] == ']':
+                in_general = line[1:-1] == 'General'
+                continue
+            if not in_general:
+                continue
+            # ConfigParser splits on the first '=' or ':'
+            delimiter = min((i for i in (line.find('='), line.find(':')) if i >= 0), default=-1)
+            if delimiter < 0:
+                continue
+            option = line[:delimiter].strip().lower()
+            if option in PATH_OPTIONS:
+                current = options[option] = [line[delimiter + 1:].strip()]
+        return {option: '\n'.join(lines).rstrip() for option, lines in options.items()}
+    
+    def _get_path_options(self) -> Optional[Dict[str, str]]:
+        """Get the path options from config.ini, re-reading only when the file has changed.
+        Returns None if the config file does not exist."""
         config_path = self._get_config_path()
-        if not config_path.exists():
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except FileNotFoundError:
+            self._path_options = None
+            self._path_options_mtime_ns = -1
             return None
         
+        if self._path_options is None or mtime_ns != self._path_options_mtime_ns:
+            self._path_options = self._scan_path_options(config_path.read_text())
+            self._path_options_mtime_ns = mtime_ns
+        return self._path_options
+    
+    def _load_general_option(self, option: str) -> Optional[str]:
+        """Load a single path option from the General section of config.ini"""
         try:
-            config = configparser.ConfigParser()
-            config.read(config_path)
-            if 'General' in config and 'clientPath' in config['General']:
-                client_path = config['General']['clientPath']
-                log.debug(f"Loaded client path from config: {client_path}")
-                return client_path
+            path_options = self._get_path_options()
+            if path_options is None:
+                return None
+            return path_options.get(option.lower())
         except Exception as e:
             log.warning(f"Failed to read config file: {e}")
         
         return None
     
-    def save_league_path(self, league_path: str):
-        """Save league path to config.ini file"""
+    def _remember_saved(self, config: configparser.ConfigParser, mtime_ns: int):
+        """Update both caches after config.ini has been written"""
+        self._parsed = config
+        self._parsed_mtime_ns = mtime_ns
+        self._path_options = {
+            option: value
+            for option, value in config['General'].items()
+            if option in PATH_OPTIONS
+        }
+        self._path_options_mtime_ns = mtime_ns
+    
+    def _save_general_options(self, values: Dict[str, str]):
+        """Set options in the General section and write config.ini back to disk.
+        Exceptions are propagated to the caller."""
         config_path = self._get_config_path()
         try:
-            config = configparser.ConfigParser()
-            
-            # Load existing config if it exists
-            if config_path.exists():
-                config.read(config_path)
+            # Reuse the cached parser so existing sections are preserved
+            config = self._get_parser()
+            
+            if config is None:
+                # No file yet: nothing to preserve, so format the single section
+                # directly instead of going through ConfigParser.write()
+                config = configparser.ConfigParser()
+                config.read_dict({'General': values})
+                content = "[General]\n" + "".join(
+                    f"{config.optionxform(option)} = {value}\n" for option, value in values.items()
+                )
+                with open(config_path, 'w') as f:
+                    f.write(content)
+                    f.flush()
+                    mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+                self._remember_saved(config, mtime_ns)
+                return
             
             # Ensure General section exists
             if 'General' not in config:
                 config.add_section('General')
             
-            # Set the league path
-            config.set('General', 'leaguePath', league_path)
+            for option, value in values.items():
+                config.set('General', option, value)
             
-            # Write to file
+            # Write to file and remember the new mtime to avoid a re-read
             with open(config_path, 'w') as f:
                 config.write(f)
-            
+                f.flush()
+                mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            self._remember_saved(config, mtime_ns)
+        except Exception:
+            # In-memory state may no longer match the file, force a re-read
+            self._parsed = None
+            self._parsed_mtime_ns = -1
+            self._path_options = None
+            self._path_options_mtime_ns = -1
+            raise
+    
+    def load_league_path(self) -> Optional[str]:
+        """Load league path (League of Legends.exe directory) from config.ini file"""
+        league_path = self._load_general_option('leaguePath')
+        if league_path is not None:
+            log.debug(f"Loaded league path from config: {league_path}")
+        elif self._path_options is None:
+            log.debug("Config file not found, will create one")
+        return league_path
+    
+    def load_client_path(self) -> Optional[str]:
+        """Load client path (LeagueClient.exe directory) from config.ini file"""
+        client_path = self._load_general_option('clientPath')
+        if client_path is not None:
+            log.debug(f"Loaded client path from config: {client_path}")
+        return client_path
+    
+    def save_league_path(self, league_path: str):
+        """Save league path to config.ini file"""
+        try:
+            self._save_general_options({'leaguePath': league_path})
             log.debug(f"Saved league path to config: {league_path}")
         except Exception as e:
             log.warning(f"Failed to save config file: {e}")
     
     def save_client_path(self, client_path: str):
         """Save client path to config.ini file"""
-        config_path = self._get_config_path()
         try:
-            config = configparser.ConfigParser()
-            
-            # Load existing config if it exists
-            if config_path.exists():
-                config.read(config_path)
-            
-            # Ensure General section exists
-            if 'General' not in config:
-                config.add_section('General')
-            
-            # Set the client path
-            config.set('General', 'clientPath', client_path)
-            
-            # Write to file
-            with open(config_path, 'w') as f:
-                config.write(f)
-            
+            self._save_general_options({'clientPath': client_path})
             log.debug(f"Saved client path to config: {client_path}")
         except Exception as e:
             log.warning(f"Failed to save config file: {e}")
     
     def save_paths(self, league_path: str, client_path: str):
         """Save both league and client paths to config.ini file"""
-        config_path = self._get_config_path()
         try:
-            config = configparser.ConfigParser()
-            
-            # Load existing config if it exists
-            if config_path.exists():
-                config.read(config_path)
-            
-            # Ensure General section exists
-            if 'General' not in config:
-                config.add_section('General')
-            
-            # Set both paths
-            config.set('General', 'leaguePath', league_path)
-            config.set('General', 'clientPath', client_path)
-            
-            # Write to file
-            with open(config_path, 'w') as f:
-                config.write(f)
-            
+            self._save_general_options({'leaguePath': league_path, 'clientPath': client_path})
             log.debug(f"Saved paths to config: league={league_path}, client={client_path}")
         except Exception as e:
             log.warning(f"Failed to save config file: {e}")
@@ -149,21 +225,11 @@ class ConfigManager:
             return None
         
         try:
-            league_dir = Path(league_path.strip())
-            # If league path ends with "Game", client is the parent
-            if league_dir.name == "Game":
-                client_dir = league_dir.parent
-                client_exe = client_dir / "LeagueClient.exe"
-                if client_exe.exists():
-                    return str(client_dir)
-            
-            # Try parent directory structure
-            parent_dir = league_dir.parent
-            client_exe = parent_dir / "LeagueClient.exe"
-            if client_exe.exists():
-                return str(parent_dir)
-            
+            # League path is either "<client>/Game" or another direct child of the
+            # client directory, so a single probe of the parent covers both layouts
+            client_dir = os.path.dirname(os.path.normpath(league_path.strip()))
+            if file_exists(os.path.join(client_dir, "LeagueClient.exe")):
+                return client_dir
             return None
         except Exception:
             return None
-
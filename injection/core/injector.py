@@ -5,9 +5,12 @@ CSLOL Skin Injector
 Handles the actual skin injection using CSLOL tools
 """
 
+import os
 import sys
+import threading
 import time
 import shutil
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Callable, List, Optional
 
@@ -26,6 +29,18 @@ from ..overlay.process_manager import ProcessManager
 
 log = get_logger()
 
+# Single helper thread that prepares extra mods alongside the main extraction
+_PREPARE_POOL: Optional[ThreadPoolExecutor] = None
+_PREPARE_POOL_LOCK = threading.Lock()
+
+
+def _get_prepare_pool() -> ThreadPoolExecutor:
+    global _PREPARE_POOL
+    with _PREPARE_POOL_LOCK:
+        if _PREPARE_POOL is None:
+            _PREPARE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ExtraModPrepare")
+        return _PREPARE_POOL
+
 
 class SkinInjector:
     """CSLOL-based skin injector"""
@@ -178,13 +193,11 @@ class SkinInjector:
                 details={"skin": skin_name},
                 hint="Download the skin first, or check your skins folder.",
             )
-            avail_zip = list(self.zips_dir.rglob('*.zip'))
-            avail_fantome = list(self.zips_dir.rglob('*.fantome'))
-            avail = avail_zip + avail_fantome
+            avail = self._sample_available_skins(10)
             if avail:
                 log.info("[INJECT] Available skins (first 10):")
-                for a in avail[:10]:
-                    log.info(f"  - {a.name}")
+                for name in avail:
+                    log.info(f"  - {name}")
             return False
         
         log.debug(f"[INJECT] Using skin file: {zp}")
@@ -197,15 +210,26 @@ class SkinInjector:
         log.debug(f"[INJECT] Directory cleanup took {clean_duration:.2f}s")
         
         extract_start = time.time()
-        mod_folder = self._extract_zip_to_mod(zp)
+        # Party/extra mods are resolved and extracted on a helper thread while
+        # our own skin extracts; both only need to be ready before mkoverlay
+        extra_future = None
+        if extra_mods_callback:
+            extra_future = _get_prepare_pool().submit(extra_mods_callback, self)
+        try:
+            mod_folder = self._extract_zip_to_mod(zp)
+        except BaseException:
+            # Never return while the helper still writes into the mods directory
+            if extra_future is not None and not extra_future.cancel():
+                wait([extra_future])
+            raise
         extract_duration = time.time() - extract_start
         log.debug(f"[INJECT] ZIP extraction took {extract_duration:.2f}s")
         
         # Create list of mods to inject (our skin + optional party/extra mods)
         mod_names = [mod_folder.name]
-        if extra_mods_callback:
+        if extra_future is not None:
             try:
-                extra = extra_mods_callback(self)
+                extra = extra_future.result()
                 if extra:
                     mod_names.extend(extra)
                     log.info(f"[INJECT] Including {len(extra)} party/extra mod(s): {', '.join(extra)}")
@@ -285,6 +309,17 @@ class SkinInjector:
             log.error(f"[INJECT] Test injection failed: {e}")
             return False
     
+    def _sample_available_skins(self, limit: int) -> List[str]:
+        """Return up to `limit` skin archive names, stopping the walk once enough are found"""
+        names: List[str] = []
+        for _dirpath, _dirnames, filenames in os.walk(self.zips_dir):
+            for filename in filenames:
+                if filename.lower().endswith(('.zip', '.fantome')):
+                    names.append(filename)
+                    if len(names) >= limit:
+                        return names
+        return names
+    
     def _run_overlay_from_path(self, overlay_path: Path) -> bool:
         """Run overlay from an overlay directory"""
         return self.overlay_manager.run_overlay_from_path(overlay_path)
@@ -292,14 +327,16 @@ class SkinInjector:
     def clean_system(self) -> bool:
         """Clean the injection system"""
         try:
-            if self.mods_dir.exists():
-                # Remove entries individually so junctions are unlinked safely
-                for entry in self.mods_dir.iterdir():
-                    safe_remove_entry(entry)
-                shutil.rmtree(self.mods_dir, ignore_errors=True)
-            overlay_dir = self.mods_dir.parent / "overlay"
-            if overlay_dir.exists():
-                shutil.rmtree(overlay_dir, ignore_errors=True)
+            # Remove entries individually so junctions are unlinked safely
+            try:
+                with os.scandir(self.mods_dir) as entries:
+                    for entry in entries:
+                        safe_remove_entry(entry.path)
+            except FileNotFoundError:
+                pass
+            # rmtree with ignore_errors tolerates missing directories
+            shutil.rmtree(self.mods_dir, ignore_errors=True)
+            shutil.rmtree(self.mods_dir.parent / "overlay", ignore_errors=True)
             log.debug("[INJECT] System cleaned successfully")
             return True
         except Exception as e:
@@ -5,8 +5,11 @@ Game Detector
 Handles detection of League of Legends game directory
 """
 
+import os
+import sys
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 # Import psutil with fallback for development environments
 try:
@@ -17,35 +20,104 @@ except ImportError:
     psutil = None
 
 from utils.core.logging import get_logger, log_success
+from utils.core.paths import file_exists
 from ..config.config_manager import ConfigManager
 
 log = get_logger()
 
+LEAGUE_CLIENT_EXE = "LeagueClient.exe"
+_LEAGUE_CLIENT_EXE_LOWER = LEAGUE_CLIENT_EXE.lower()
+DETECTED_PATHS_TTL_S = 30.0  # How long a process-detected path pair is reused
+
+# Win32 process enumeration (avoids psutil's per-process attribute queries)
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_IMAGE_NAME_BUFFER_LEN = 32768
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32")
+    _psapi = ctypes.WinDLL("psapi")
+
+    _EnumProcesses = _psapi.EnumProcesses
+    _EnumProcesses.argtypes = [ctypes.POINTER(wintypes.DWORD), wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)]
+    _EnumProcesses.restype = wintypes.BOOL
+
+    _OpenProcess = _kernel32.OpenProcess
+    _OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _OpenProcess.restype = wintypes.HANDLE
+
+    _QueryFullProcessImageNameW = _kernel32.QueryFullProcessImageNameW
+    _QueryFullProcessImageNameW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)]
+    _QueryFullProcessImageNameW.restype = wintypes.BOOL
+
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+else:
+    _EnumProcesses = None
+
+
+def _enum_process_ids_win32() -> Optional[List[int]]:
+    """Return the IDs of all running processes via EnumProcesses.
+    Returns None if enumeration fails."""
+    capacity = 1024
+    while True:
+        pids = (wintypes.DWORD * capacity)()
+        needed = wintypes.DWORD()
+        if not _EnumProcesses(pids, ctypes.sizeof(pids), ctypes.byref(needed)):
+            return None
+        # A completely filled buffer may have been truncated, retry with more room
+        if needed.value < ctypes.sizeof(pids):
+            break
+        capacity *= 2
+    return pids[:needed.value // ctypes.sizeof(wintypes.DWORD)]
+
+
+def _get_image_path_win32(pid: int, buf, size) -> Optional[str]:
+    """Return the executable path of a process, or None if it cannot be queried."""
+    handle = _OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None  # Protected/system process or already exited
+    try:
+        size.value = _IMAGE_NAME_BUFFER_LEN
+        if not _QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+            return None
+        return buf.value
+    finally:
+        _CloseHandle(handle)
+
 
 class GameDetector:
     """Detects League of Legends game and client directories"""
     
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
+        # Last successful process-based detection, reused for DETECTED_PATHS_TTL_S
+        self._detected_paths: Optional[Tuple[Path, Path]] = None
+        self._detected_at: float = 0.0
+        # PID of the last LeagueClient.exe seen, probed before a full scan
+        self._leagueclient_pid: Optional[int] = None
     
     def detect_paths(self) -> Tuple[Optional[Path], Optional[Path]]:
         """Auto-detect League of Legends game and client directories.
         Returns (game_path, client_path) tuple. Both can be None if not found."""
         
-        # First, try to load from config
+        # First, try the config: each step only runs if the previous one succeeded,
+        # so a valid config costs one parse and two attribute probes
         config_league_path = self.config_manager.load_league_path()
-        config_client_path = self.config_manager.load_client_path()
-        
-        if config_league_path and config_client_path:
-            league_dir = Path(config_league_path)
-            client_dir = Path(config_client_path)
-            
-            if (league_dir.exists() and (league_dir / "League of Legends.exe").exists() and
-                client_dir.exists() and (client_dir / "LeagueClient.exe").exists()):
-                log_success(log, f"Using paths from config: league={league_dir}, client={client_dir}", "")
-                return league_dir, client_dir
+        if config_league_path:
+            if file_exists(os.path.join(config_league_path, "League of Legends.exe")):
+                config_client_path = self.config_manager.load_client_path()
+                if config_client_path and file_exists(os.path.join(config_client_path, LEAGUE_CLIENT_EXE)):
+                    league_dir = Path(config_league_path)
+                    client_dir = Path(config_client_path)
+                    log_success(log, f"Using paths from config: league={league_dir}, client={client_dir}", "")
+                    return league_dir, client_dir
+                log.warning(f"Config client path is invalid: {config_client_path}")
             else:
-                log.warning(f"Config paths are invalid: league={config_league_path}, client={config_client_path}")
+                log.warning(f"Config league path is invalid: {config_league_path}")
         
         # If no valid config, try to detect via LeagueClient.exe
         log.debug("Config not found or invalid, detecting via LeagueClient.exe")
@@ -69,52 +141,19 @@ class GameDetector:
     def _detect_via_leagueclient(self) -> Tuple[Optional[Path], Optional[Path]]:
         """Detect League paths by finding running LeagueClient.exe process.
         Returns (game_path, client_path) tuple."""
-        if not PSUTIL_AVAILABLE:
-            log.debug("psutil not available, skipping LeagueClient.exe detection")
-            return None, None
-            
+        if (self._detected_paths is not None and
+                time.monotonic() - self._detected_at < DETECTED_PATHS_TTL_S):
+            return self._detected_paths
+        
         try:
             log.debug("Looking for LeagueClient.exe process...")
             
-            # Find LeagueClient.exe process
-            for proc in psutil.process_iter(['pid', 'name', 'exe']):
-                try:
-                    if proc.info['name'] == 'LeagueClient.exe':
-                        exe_path = proc.info['exe']
-                        if exe_path:
-                            log.debug(f"Found LeagueClient.exe at: {exe_path}")
-                            
-                            # Convert to Path and get parent directory
-                            client_path = Path(exe_path)
-                            client_dir = client_path.parent
-                            
-                            # Verify client directory has LeagueClient.exe
-                            if not (client_dir / "LeagueClient.exe").exists():
-                                continue
-                            
-                            # League should be in the same directory + "Game" subdirectory
-                            league_dir = client_dir / "Game"
-                            league_exe = league_dir / "League of Legends.exe"
-                            
-                            log.debug(f"Checking for League at: {league_exe}")
-                            if league_exe.exists():
-                                log_success(log, f"Found League via LeagueClient.exe: game={league_dir}, client={client_dir}", "")
-                                return league_dir, client_dir
-                            else:
-                                log.debug(f"League not found at expected location: {league_exe}")
-                                
-                                # Try parent directory structure (for different installers)
-                                parent_dir = client_dir.parent
-                                parent_league_dir = parent_dir / "League of Legends" / "Game"
-                                parent_league_exe = parent_league_dir / "League of Legends.exe"
-                                
-                                log.debug(f"Trying parent directory structure: {parent_league_exe}")
-                                if parent_league_exe.exists():
-                                    log_success(log, f"Found League via parent directory: game={parent_league_dir}, client={client_dir}", "")
-                                    return parent_league_dir, client_dir
-                                
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
+            for exe_path in self._find_leagueclient_exes():
+                paths = self._resolve_paths_from_client_exe(exe_path)
+                if paths is not None:
+                    self._detected_paths = paths
+                    self._detected_at = time.monotonic()
+                    return paths
             
             log.debug("No LeagueClient.exe process found")
             return None, None
@@ -122,4 +161,97 @@ class GameDetector:
         except Exception as e:
             log.warning(f"Error detecting via LeagueClient.exe: {e}")
             return None, None
-
+    
+    def _find_leagueclient_exes(self) -> Iterator[str]:
+        """Yield executable paths of running LeagueClient.exe processes.
+        Uses the Win32 API directly on Windows, psutil elsewhere or on failure.
+        The last known client PID is checked first, and paths are produced
+        lazily so the caller can stop at the first usable match."""
+        if _EnumProcesses is not None:
+            pids = _enum_process_ids_win32()
+            if pids is not None:
+                yield from self._iter_leagueclient_exes_win32(pids)
+                return
+            log.debug("EnumProcesses failed, falling back to psutil")
+        
+        if not PSUTIL_AVAILABLE:
+            log.debug("psutil not available, skipping LeagueClient.exe detection")
+            return
+        
+        yield from self._iter_leagueclient_exes_psutil()
+    
+    def _iter_leagueclient_exes_win32(self, pids: List[int]) -> Iterator[str]:
+        buf = ctypes.create_unicode_buffer(_IMAGE_NAME_BUFFER_LEN)
+        size = wintypes.DWORD()
+        
+        cached_pid = self._leagueclient_pid
+        if cached_pid in pids:
+            image_path = _get_image_path_win32(cached_pid, buf, size)
+            if image_path and image_path.rpartition("\\")[2].lower() == _LEAGUE_CLIENT_EXE_LOWER:
+                yield image_path
+        
+        for pid in pids:
+            if not pid or pid == cached_pid:
+                continue
+            image_path = _get_image_path_win32(pid, buf, size)
+            if image_path and image_path.rpartition("\\")[2].lower() == _LEAGUE_CLIENT_EXE_LOWER:
+                self._leagueclient_pid = pid
+                yield image_path
+    
+    def _iter_leagueclient_exes_psutil(self) -> Iterator[str]:
+        cached_pid = self._leagueclient_pid
+        if cached_pid is not None:
+            try:
+                proc = psutil.Process(cached_pid)
+                if proc.name() == LEAGUE_CLIENT_EXE:
+                    exe_path = proc.exe()
+                    if exe_path:
+                        yield exe_path
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                pass
+        
+        # Only the name is prefetched; exe() is queried for matching processes only
+        for proc in psutil.process_iter(['name']):
+            try:
+                if proc.pid == cached_pid or proc.info['name'] != LEAGUE_CLIENT_EXE:
+                    continue
+                exe_path = proc.exe()
+                if exe_path:
+                    self._leagueclient_pid = proc.pid
+                    yield exe_path
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+    
+    def _resolve_paths_from_client_exe(self, exe_path: str) -> Optional[Tuple[Path, Path]]:
+        """Resolve (game_path, client_path) from a LeagueClient.exe path.
+        Returns None if no League installation is found next to it."""
+        log.debug(f"Found LeagueClient.exe at: {exe_path}")
+        
+        # Work on strings for the probes and only build Path objects for the result
+        client_dir = os.path.dirname(exe_path)
+        
+        # Verify client directory has LeagueClient.exe
+        if not file_exists(os.path.join(client_dir, LEAGUE_CLIENT_EXE)):
+            return None
+        
+        # League should be in the same directory + "Game" subdirectory
+        league_dir = os.path.join(client_dir, "Game")
+        league_exe = os.path.join(league_dir, "League of Legends.exe")
+        
+        log.debug(f"Checking for League at: {league_exe}")
+        if file_exists(league_exe):
+            log_success(log, f"Found League via LeagueClient.exe: game={league_dir}, client={client_dir}", "")
+            return Path(league_dir), Path(client_dir)
+        
+        log.debug(f"League not found at expected location: {league_exe}")
+        
+        # Try parent directory structure (for different installers)
+        parent_league_dir = os.path.join(os.path.dirname(client_dir), "League of Legends", "Game")
+        parent_league_exe = os.path.join(parent_league_dir, "League of Legends.exe")
+        
+        log.debug(f"Trying parent directory structure: {parent_league_exe}")
+        if file_exists(parent_league_exe):
+            log_success(log, f"Found League via parent directory: game={parent_league_dir}, client={client_dir}", "")
+            return Path(parent_league_dir), Path(client_dir)
+        
+        return None
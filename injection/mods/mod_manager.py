@@ -5,14 +5,15 @@ Mod Manager
 Handles mod extraction, installation, and management
 """
 
-import shutil
+import os
+import threading
 from pathlib import Path
 from typing import List
 
 from utils.core.logging import get_logger, log_success
 from utils.core.paths import get_user_data_dir
 from utils.core.safe_extract import safe_extractall
-from utils.core.junction import is_junction, safe_remove_entry
+from utils.core.junction import discard_tree, is_junction, safe_remove_entry
 
 log = get_logger()
 
@@ -23,35 +24,48 @@ class ModManager:
     def __init__(self, mods_dir: Path):
         self.mods_dir = mods_dir
         self.mods_dir.mkdir(parents=True, exist_ok=True)
+        self._target_locks = {}
+        self._target_locks_guard = threading.Lock()
 
     def clean_mods_dir(self):
         """Clean the mods directory"""
-        if not self.mods_dir.exists():
+        try:
+            with os.scandir(self.mods_dir) as entries:
+                for entry in entries:
+                    safe_remove_entry(entry.path)
+        except FileNotFoundError:
             self.mods_dir.mkdir(parents=True, exist_ok=True)
-            return
-        for p in self.mods_dir.iterdir():
-            safe_remove_entry(p)
 
     def clean_overlay_dir(self):
         """Clean the overlay directory to prevent file lock issues"""
         overlay_dir = self.mods_dir.parent / "overlay"
-        if overlay_dir.exists():
-            try:
-                shutil.rmtree(overlay_dir, ignore_errors=True)
-                log.debug("[INJECT] Cleaned overlay directory")
-            except Exception as e:
-                log.warning(f"[INJECT] Failed to clean overlay directory: {e}")
+        try:
+            # The old WADs are deleted in the background so extraction can start right away
+            discard_tree(overlay_dir)
+            log.debug("[INJECT] Cleaned overlay directory")
+        except Exception as e:
+            log.warning(f"[INJECT] Failed to clean overlay directory: {e}")
         overlay_dir.mkdir(parents=True, exist_ok=True)
 
+    def _target_lock(self, name: str) -> threading.Lock:
+        """Lock serializing extractions into the same mod folder"""
+        with self._target_locks_guard:
+            lock = self._target_locks.get(name)
+            if lock is None:
+                lock = self._target_locks[name] = threading.Lock()
+            return lock
+
     def extract_zip_to_mod(self, zp: Path) -> Path:
-        """Extract a ZIP-compatible skin archive to the mod directory."""
+        """Extract a ZIP-compatible skin archive to the mod directory.
+        Safe to call from several threads; archives sharing a name are extracted one at a time."""
         target = self.mods_dir / zp.stem
-        if target.exists():
-            shutil.rmtree(target, ignore_errors=True)
-        target.mkdir(parents=True, exist_ok=True)
+        with self._target_lock(zp.stem):
+            # Move any previous extraction aside and delete it in the background
+            discard_tree(target)
+            target.mkdir(parents=True, exist_ok=True)
 
-        # Security: Use safe extraction to prevent path traversal attacks.
-        safe_extractall(zp, target)
+            # Security: Use safe extraction to prevent path traversal attacks.
+            safe_extractall(zp, target)
 
         # Hide extracted files so they can't be easily browsed
         self._hide_directory(target)
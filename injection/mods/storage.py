@@ -10,25 +10,46 @@ from __future__ import annotations
 from dataclasses import dataclass
 import hashlib
 import json
+import os
 import shutil
 import tempfile
 import threading
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Optional
 
 from utils.core.junction import safe_remove_entry
 from utils.core.logging import get_logger
-from utils.core.paths import get_user_data_dir
+from utils.core.paths import dir_exists, get_user_data_dir
 from utils.core.safe_extract import safe_extractall
 from utils.core.utilities import get_champion_id_from_skin_id
 
 log = get_logger()
 _STORAGE_LOCK = threading.RLock()
+# Mods roots whose category layout was already ensured by this process.
+# The service is instantiated on many hot paths, so only the first
+# instance per root pays for the mkdir/cleanup pass.
+_LAYOUT_READY_ROOTS: set[Path] = set()
+# Shared pool for reading mod descriptors of large listings
+_DESCRIPTION_POOL: Optional[ThreadPoolExecutor] = None
+_DESCRIPTION_POOL_LOCK = threading.Lock()
+
+
+def _get_description_pool() -> ThreadPoolExecutor:
+    global _DESCRIPTION_POOL
+    with _DESCRIPTION_POOL_LOCK:
+        if _DESCRIPTION_POOL is None:
+            _DESCRIPTION_POOL = ThreadPoolExecutor(
+                max_workers=ModStorageService.DESCRIPTION_READ_WORKERS,
+                thread_name_prefix="ModDescription",
+            )
+        return _DESCRIPTION_POOL
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkinModEntry:
     """Metadata for a mod inside a champion-level skin directory."""
 
@@ -45,6 +66,10 @@ class ModStorageService:
     """Service exposing the on-disk mods hierarchy."""
 
     CHAMPION_LIST_CACHE_SECONDS = 0.75
+    # Listings with at least this many mods read their descriptors in
+    # parallel; below it the thread hand-off costs more than it hides.
+    PARALLEL_DESCRIPTION_THRESHOLD = 8
+    DESCRIPTION_READ_WORKERS = 8
     # MAX_PATH is 260 including the terminating null character, so keep the
     # visible path at 259 characters or fewer for legacy Windows APIs.
     MAX_WINDOWS_PATH_LENGTH = 259
@@ -55,6 +80,7 @@ class ModStorageService:
     IMPORT_TEMP_PREFIX = ".rose-import-"
     TARGET_METADATA = "rose_mod_targets.json"
     LEGACY_TARGET_METADATA = "rose_wad_targets.json"
+    TARGET_METADATA_FILES = frozenset({TARGET_METADATA, LEGACY_TARGET_METADATA})
     CATEGORY_METADATA = "rose_category_mods.json"
 
     CATEGORY_SKINS = "skins"
@@ -79,26 +105,24 @@ class ModStorageService:
         CATEGORY_SFX,
         CATEGORY_OTHERS,
     )
-    MOD_CATEGORIES = (
-        CATEGORY_MAPS,
-        CATEGORY_FONTS,
-        CATEGORY_ANNOUNCERS,
-        CATEGORY_UI,
-        CATEGORY_VOICEOVER,
-        CATEGORY_LOADING_SCREEN,
-        CATEGORY_VFX,
-        CATEGORY_SFX,
-        CATEGORY_OTHERS,
-    )
+    # Every root category except skins, which are stored per champion
+    MOD_CATEGORIES = ROOT_CATEGORIES[1:]
 
     def __init__(self, mods_root: Optional[Path] = None):
         self.mods_root = mods_root or (get_user_data_dir() / "mods")
+        self._skins_dir = self.mods_root / self.CATEGORY_SKINS
+        self._skins_dir_str = str(self._skins_dir)
         self._storage_lock = _STORAGE_LOCK
+        # champion_id -> (checked_at, mtimes of watched paths, watched paths, entries)
         self._champion_listing_cache: dict[
-            int, tuple[float, tuple[SkinModEntry, ...]]
+            int,
+            tuple[float, tuple[int, ...], tuple[str, ...], tuple[SkinModEntry, ...]],
         ] = {}
-        self.mods_root.mkdir(parents=True, exist_ok=True)
-        self._ensure_mods_root_layout()
+        with _STORAGE_LOCK:
+            if self.mods_root not in _LAYOUT_READY_ROOTS:
+                self.mods_root.mkdir(parents=True, exist_ok=True)
+                self._ensure_mods_root_layout()
+                _LAYOUT_READY_ROOTS.add(self.mods_root)
 
     @classmethod
     def _choose_archive_destination(
@@ -175,11 +199,13 @@ class ModStorageService:
 
         # Remove unknown root-level directories
         try:
-            for entry in self.mods_root.iterdir():
-                if not entry.is_dir():
-                    continue
-                if entry.name in self.ROOT_CATEGORIES:
-                    continue
+            with os.scandir(self.mods_root) as it:
+                unknown_dirs = [
+                    Path(entry.path)
+                    for entry in it
+                    if entry.is_dir() and entry.name not in self.ROOT_CATEGORIES
+                ]
+            for entry in unknown_dirs:
                 try:
                     shutil.rmtree(entry, ignore_errors=True)
                     log.info("[ModStorage] Removed unknown mods category folder: %s", entry)
@@ -190,7 +216,7 @@ class ModStorageService:
 
     @property
     def skins_dir(self) -> Path:
-        return self.mods_root / self.CATEGORY_SKINS
+        return self._skins_dir
 
     def get_skin_dir(self, skin_id: int | str) -> Path:
         return self.skins_dir / str(skin_id)
@@ -200,7 +226,11 @@ class ModStorageService:
         champion_id_int = self._to_int(champion_id)
         if champion_id_int is None:
             raise ValueError(f"Invalid champion ID: {champion_id}")
-        return self.get_skin_dir(champion_id_int * 1000)
+        return self._champion_dir(champion_id_int)
+
+    def _champion_dir(self, champion_id: int) -> Path:
+        """``get_champion_dir`` for callers that already validated an int ID."""
+        return Path(os.path.join(self._skins_dir_str, str(champion_id * 1000)))
 
     @staticmethod
     def _normalize_target_ids(value: object) -> tuple[int, ...]:
@@ -231,9 +261,8 @@ class ModStorageService:
 
     def _load_target_manifest(
         self,
-        champion_id: int,
+        champion_dir: Path,
     ) -> tuple[tuple[int, ...], dict[str, dict]]:
-        champion_dir = self.get_champion_dir(champion_id)
         payload = None
         for metadata_name in (self.TARGET_METADATA, self.LEGACY_TARGET_METADATA):
             manifest_path = champion_dir / metadata_name
@@ -268,19 +297,22 @@ class ModStorageService:
         """Return a rename-stable folder hash and hashes for contained WADs."""
         folder_hash = hashlib.sha256()
         wad_hashes: dict[str, str] = {}
-        try:
-            files = sorted(
-                (path for path in mod_path.rglob("*") if path.is_file()),
-                key=lambda path: path.relative_to(mod_path).as_posix().casefold(),
-            )
-        except OSError:
-            files = []
-
-        for file_path in files:
+        # os.walk classifies entries from the directory listing itself, so
+        # unlike rglob() + is_file() there is no stat per file.
+        root = str(mod_path)
+        prefix_length = len(os.path.join(root, ""))
+        files = []
+        for directory, _, filenames in os.walk(root):
+            for filename in filenames:
+                file_path = os.path.join(directory, filename)
+                relative_path = file_path[prefix_length:].replace(os.sep, "/")
+                files.append((relative_path.casefold(), relative_path, file_path))
+        files.sort()
+
+        for _, relative_path, file_path in files:
             try:
-                relative_path = file_path.relative_to(mod_path).as_posix()
                 file_hash = hashlib.sha256()
-                with file_path.open("rb") as stream:
+                with open(file_path, "rb") as stream:
                     for chunk in iter(lambda: stream.read(1024 * 1024), b""):
                         file_hash.update(chunk)
                 file_digest = file_hash.digest()
@@ -357,9 +389,9 @@ class ModStorageService:
         if not targets:
             raise ValueError("At least one target skin ID is required")
 
-        champion_dir = self.get_champion_dir(champion_id_int)
+        champion_dir = self._champion_dir(champion_id_int)
         champion_dir.mkdir(parents=True, exist_ok=True)
-        default_targets, mod_targets = self._load_target_manifest(champion_id_int)
+        default_targets, mod_targets = self._load_target_manifest(champion_dir)
         if mod_name:
             if mod_path is not None:
                 folder_hash, wad_hashes = self._hash_mod_folder(Path(mod_path))
@@ -416,7 +448,7 @@ class ModStorageService:
         if champion_id_int is None or champion_id_int <= 0:
             raise ValueError(f"Invalid champion ID: {champion_id}")
 
-        champion_dir = self.get_champion_dir(champion_id_int)
+        champion_dir = self._champion_dir(champion_id_int)
         champion_dir.mkdir(parents=True, exist_ok=True)
         base_name = source.stem.strip()
         if not base_name or base_name in {".", ".."}:
@@ -540,7 +572,7 @@ class ModStorageService:
                 safe_remove_entry(target_dir)
             raise
 
-    def _list_mods_in_directory(
+    def _collect_mods_in_directory(
         self,
         mod_directory: Path,
         champion_id: int,
@@ -548,24 +580,42 @@ class ModStorageService:
         default_targets: tuple[int, ...] = (),
         mod_targets: Optional[dict[str, tuple[int, ...]]] = None,
         require_manifest: bool = False,
-    ) -> List[SkinModEntry]:
-        if not mod_directory.exists() or not mod_directory.is_dir():
+    ) -> List[tuple[dict, bool]]:
+        """Return ``(entry fields, is_dir)`` for each mod in a directory.
+
+        Descriptions are left out so a whole listing can read them in one
+        batch through ``_build_mod_entries``.
+        """
+        # A single scandir pass: DirEntry carries the file type (and on
+        # Windows the stat data), so no extra syscalls per child.  Entries
+        # are classified while scanning so only actual mods get sorted, on
+        # a lowercased name computed once per entry.
+        mods_found = []
+        try:
+            with os.scandir(mod_directory) as it:
+                for dir_entry in it:
+                    name = dir_entry.name
+                    if name in self.TARGET_METADATA_FILES:
+                        continue
+                    is_dir = dir_entry.is_dir()
+                    if is_dir:
+                        mod_name = name
+                    else:
+                        mod_name, extension = os.path.splitext(name)
+                        if extension.lower() not in {".zip", ".fantome"} or not dir_entry.is_file():
+                            continue
+                    mods_found.append((name.lower(), dir_entry, is_dir, mod_name))
+        except OSError:
             return []
+        mods_found.sort(key=itemgetter(0))
 
-        entries: List[SkinModEntry] = []
+        pending: List[tuple[dict, bool]] = []
         mod_targets = mod_targets or {}
-        for candidate in sorted(mod_directory.iterdir(), key=lambda p: p.name.lower()):
-            if candidate.name in {self.TARGET_METADATA, self.LEGACY_TARGET_METADATA}:
-                continue
-            if candidate.is_dir():
-                mod_name = candidate.name
-            elif candidate.is_file() and candidate.suffix.lower() in {".zip", ".fantome"}:
-                mod_name = candidate.stem
-            else:
-                continue
+        for _, dir_entry, is_dir, mod_name in mods_found:
+            candidate = Path(dir_entry.path)
 
             try:
-                updated_at = candidate.stat().st_mtime
+                updated_at = dir_entry.stat().st_mtime
             except OSError:
                 updated_at = 0.0
 
@@ -580,18 +630,42 @@ class ModStorageService:
                 if require_manifest:
                     continue
                 target_skin_ids = (storage_skin_id,)
-            entries.append(
-                SkinModEntry(
-                    champion_id=champion_id,
-                    skin_id=storage_skin_id,
-                    mod_name=mod_name,
-                    path=candidate,
-                    updated_at=updated_at,
-                    description=self._read_mod_description(candidate),
-                    target_skin_ids=tuple(target_skin_ids),
-                )
+            pending.append((
+                {
+                    "champion_id": champion_id,
+                    "skin_id": storage_skin_id,
+                    "mod_name": mod_name,
+                    "path": candidate,
+                    "updated_at": updated_at,
+                    "target_skin_ids": tuple(target_skin_ids),
+                },
+                is_dir,
+            ))
+        return pending
+
+    def _build_mod_entries(self, pending: List[tuple[dict, bool]]) -> List[SkinModEntry]:
+        """Create entries for collected mods, reading all descriptions as one batch."""
+        descriptions = self._read_mod_descriptions(
+            [(fields["path"], is_dir) for fields, is_dir in pending]
+        )
+        return [
+            SkinModEntry(**fields, description=description)
+            for (fields, _), description in zip(pending, descriptions)
+        ]
+
+    def _read_mod_descriptions(
+        self,
+        candidates: List[tuple[Path, bool]],
+    ) -> List[Optional[str]]:
+        """Read descriptors for many mods, in parallel for large batches."""
+        if len(candidates) < self.PARALLEL_DESCRIPTION_THRESHOLD:
+            return [self._read_mod_description(path, is_dir) for path, is_dir in candidates]
+        return list(
+            _get_description_pool().map(
+                lambda candidate: self._read_mod_description(*candidate),
+                candidates,
             )
-        return entries
+        )
 
     def list_mods_for_skin(self, skin_id: int | str) -> List[SkinModEntry]:
         """Return mods for a skin, including champion-level target metadata."""
@@ -599,11 +673,11 @@ class ModStorageService:
         if skin_id_int is None:
             return []
         champion_id = get_champion_id_from_skin_id(skin_id_int)
-        if champion_id is None:
+        if champion_id is None or champion_id <= 0:
             return []
         return [
             entry
-            for entry in self.list_mods_for_champion(champion_id)
+            for entry in self._list_mods_for_champion(champion_id)
             if skin_id_int in entry.target_skin_ids
         ]
 
@@ -612,17 +686,63 @@ class ModStorageService:
         champion_id_int = self._to_int(champion_id)
         if champion_id_int is None or champion_id_int <= 0:
             return []
+        return self._list_mods_for_champion(champion_id_int)
 
+    def _list_mods_for_champion(self, champion_id_int: int) -> List[SkinModEntry]:
+        """``list_mods_for_champion`` for an already validated, positive int ID."""
+
+        champion_directory = self._champion_dir(champion_id_int)
         cached = self._champion_listing_cache.get(champion_id_int)
         if cached is not None:
-            cached_at, cached_entries = cached
-            if time.monotonic() - cached_at < self.CHAMPION_LIST_CACHE_SECONDS:
+            checked_at, signature, watched_paths, cached_entries = cached
+            now = time.monotonic()
+            if now - checked_at < self.CHAMPION_LIST_CACHE_SECONDS:
+                return list(cached_entries)
+            # Adding, removing or renaming a mod (or rewriting the target
+            # manifest) bumps the mtime of its parent directory, and editing
+            # a mod or its descriptor in place bumps that file's own mtime,
+            # so an unchanged signature means the cached listing is still valid.
+            if self._listing_signature(watched_paths) == signature:
+                self._champion_listing_cache[champion_id_int] = (
+                    now,
+                    signature,
+                    watched_paths,
+                    cached_entries,
+                )
                 return list(cached_entries)
 
+        # Keep older per-skin imports readable without creating new per-skin
+        # directories for the restored manual import flow.
+        # Cheap name checks run first so only this champion's folders pay for
+        # the type check, and only those few get sorted and wrapped in Path.
+        legacy_found = []
+        try:
+            with os.scandir(self.skins_dir) as it:
+                for child in it:
+                    # Directory names are always str: a digit check is cheaper
+                    # than letting int() raise for every non-numeric folder.
+                    name = child.name
+                    if not name.isdecimal() or name == champion_directory.name:
+                        continue
+                    legacy_skin_id = int(name)
+                    if get_champion_id_from_skin_id(legacy_skin_id) != champion_id_int:
+                        continue
+                    if child.is_dir():
+                        legacy_found.append((name.lower(), legacy_skin_id, child.path))
+        except OSError:
+            legacy_found = []
+        legacy_found.sort(key=itemgetter(0))
+        legacy_directories = tuple(Path(path) for _, _, path in legacy_found)
+
+        # Take the signature before reading so concurrent changes force a rescan
+        watched_paths = tuple(
+            str(directory)
+            for directory in (self.skins_dir, champion_directory, *legacy_directories)
+        )
+        signature = self._listing_signature(watched_paths)
         champion_storage_id = champion_id_int * 1000
-        champion_directory = self.get_champion_dir(champion_id_int)
-        default_targets, mod_targets = self._load_target_manifest(champion_id_int)
-        entries = self._list_mods_in_directory(
+        default_targets, mod_targets = self._load_target_manifest(champion_directory)
+        pending = self._collect_mods_in_directory(
             champion_directory,
             champion_id_int,
             champion_storage_id,
@@ -630,21 +750,9 @@ class ModStorageService:
             mod_targets,
             require_manifest=True,
         )
-
-        # Keep older per-skin imports readable without creating new per-skin
-        # directories for the restored manual import flow.
-        try:
-            legacy_directories = sorted(self.skins_dir.iterdir(), key=lambda p: p.name.lower())
-        except OSError:
-            legacy_directories = []
-        for child in legacy_directories:
-            if not child.is_dir() or child == champion_directory:
-                continue
-            legacy_skin_id = self._to_int(child.name)
-            if legacy_skin_id is None or get_champion_id_from_skin_id(legacy_skin_id) != champion_id_int:
-                continue
-            entries.extend(
-                self._list_mods_in_directory(
+        for child, (_, legacy_skin_id, _) in zip(legacy_directories, legacy_found):
+            pending.extend(
+                self._collect_mods_in_directory(
                     child,
                     champion_id_int,
                     legacy_skin_id,
@@ -652,12 +760,35 @@ class ModStorageService:
                     require_manifest=True,
                 )
             )
+        # Mods and their descriptors are watched too, stamped before the
+        # descriptors are read
+        mod_files = tuple(
+            path
+            for fields, is_dir in pending
+            for path in (str(fields["path"]), self._description_path(fields["path"], is_dir))
+        )
+        watched_paths += mod_files
+        signature += self._listing_signature(mod_files)
+        entries = self._build_mod_entries(pending)
         self._champion_listing_cache[champion_id_int] = (
             time.monotonic(),
+            signature,
+            watched_paths,
             tuple(entries),
         )
         return list(entries)
 
+    @staticmethod
+    def _listing_signature(paths: tuple[str, ...]) -> tuple[int, ...]:
+        """Return the mtime of every path a champion listing is built from (-1 if missing)."""
+        signature = []
+        for path in paths:
+            try:
+                signature.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                signature.append(-1)
+        return tuple(signature)
+
     def has_mods_for_skin(self, skin_id: int | str) -> bool:
         return bool(self.list_mods_for_skin(skin_id))
 
@@ -678,20 +809,27 @@ class ModStorageService:
             return []
         
         category_dir = self.mods_root / category
-        if not category_dir.exists() or not category_dir.is_dir():
+        try:
+            with os.scandir(category_dir) as it:
+                dir_entries = sorted(
+                    (entry for entry in it if entry.is_dir()),
+                    key=lambda entry: entry.name.lower(),
+                )
+        except OSError:
             return []
 
         registered_mods = self._load_category_manifest(category)
         entries = []
-        for candidate in sorted(category_dir.iterdir(), key=lambda p: p.name.lower()):
-            if not candidate.is_dir() or candidate.name == self.CATEGORY_METADATA:
+        for dir_entry in dir_entries:
+            if dir_entry.name == self.CATEGORY_METADATA:
                 continue
-            mod_name = candidate.name
+            mod_name = dir_entry.name
             if mod_name.casefold() not in registered_mods:
                 continue
+            candidate = Path(dir_entry.path)
             
             try:
-                updated_at = candidate.stat().st_mtime
+                updated_at = dir_entry.stat().st_mtime
             except OSError:
                 updated_at = 0.0
             
@@ -705,7 +843,7 @@ class ModStorageService:
                 "name": mod_name,
                 "path": str(relative_path).replace("\\", "/"),
                 "updatedAt": updated_at,
-                "description": self._read_mod_description(candidate),
+                "description": self._read_mod_description(candidate, is_dir=True),
             })
         
         return entries
@@ -718,12 +856,23 @@ class ModStorageService:
             return None
 
     @staticmethod
-    def _read_mod_description(candidate: Path) -> Optional[str]:
-        description_file = candidate / "description.txt" if candidate.is_dir() else candidate.with_suffix(".txt")
-        if not description_file.exists():
-            return None
+    def _description_path(candidate: Path, is_dir: bool) -> str:
+        if is_dir:
+            return os.path.join(candidate, "description.txt")
+        return os.path.splitext(candidate)[0] + ".txt"
+
+    @classmethod
+    def _read_mod_description(cls, candidate: Path, is_dir: Optional[bool] = None) -> Optional[str]:
+        if is_dir is None:
+            is_dir = dir_exists(candidate)
+        description_file = cls._description_path(candidate, is_dir)
+        # Most mods ship without a descriptor, so open directly instead of
+        # probing with exists() first: the miss costs a single failed open.
         try:
-            return description_file.read_text(encoding="utf-8").strip()
+            with open(description_file, "r", encoding="utf-8") as stream:
+                return stream.read().strip()
+        except FileNotFoundError:
+            return None
         except Exception as exc:
             log.debug(f"[ModStorage] Unable to read descriptor {description_file}: {exc}")
             return None
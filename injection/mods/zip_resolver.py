@@ -5,8 +5,9 @@ ZIP Resolver
 Handles resolution of skin and chroma ZIP files
 """
 
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from utils.core.logging import get_logger, log_success
 
@@ -25,12 +26,25 @@ def _find_by_extensions(base: Path, stem: str) -> Optional[Path]:
 
 
 def _rglob_by_extensions(base: Path, pattern_stem: str) -> Optional[Path]:
-    """Search recursively for a file with any skin extension, return first match."""
-    for ext in SKIN_EXTENSIONS:
-        matches = list(base.rglob(f"**/{pattern_stem}{ext}"))
-        if matches:
-            return matches[0]
-    return None
+    """Search recursively for a file with any skin extension, return first match.
+    The tree is walked once for all extensions, earlier SKIN_EXTENSIONS win.
+    Names are compared with normcase, so matching is case-insensitive on Windows
+    like Path.rglob."""
+    ranks = {
+        os.path.normcase(f"{pattern_stem}{ext}"): rank
+        for rank, ext in enumerate(SKIN_EXTENSIONS)
+    }
+    best_path = None
+    best_rank = len(SKIN_EXTENSIONS)
+    for dirpath, _dirnames, filenames in os.walk(base):
+        for filename in filenames:
+            rank = ranks.get(os.path.normcase(filename))
+            if rank is not None and rank < best_rank:
+                best_path = os.path.join(dirpath, filename)
+                best_rank = rank
+                if rank == 0:
+                    return Path(best_path)
+    return Path(best_path) if best_path else None
 
 
 class ZipResolver:
@@ -39,6 +53,8 @@ class ZipResolver:
     def __init__(self, zips_dir: Path):
         self.zips_dir = zips_dir
         self.zips_dir.mkdir(parents=True, exist_ok=True)
+        # Per champion: chroma directory name -> chroma directory path
+        self._chroma_dirs: Dict[str, Dict[str, str]] = {}
     
     def resolve_zip(self, zip_arg: str, chroma_id: int = None, skin_name: str = None, champion_name: str = None, champion_id: int = None) -> Optional[Path]:
         """Resolve a ZIP by name or path with fuzzy matching, supporting new merged structure
@@ -138,34 +154,57 @@ class ZipResolver:
     
     def _resolve_chroma_by_id(self, champion_id: int, chroma_id: int) -> Optional[Path]:
         """Resolve chroma ZIP by champion ID and chroma ID"""
-        champion_dir = self.zips_dir / str(champion_id)
-        if not champion_dir.exists():
-            log.warning(f"[INJECT] Champion directory not found: {champion_dir}")
-            return None
+        champion_key = str(champion_id)
+        chroma_name = str(chroma_id)
         
-        # Search through all skin directories for this champion to find the chroma
-        for skin_dir in champion_dir.iterdir():
-            if not skin_dir.is_dir():
-                continue
-            
-            # Check if this is a skin directory (numeric name)
-            try:
-                int(skin_dir.name)  # If this succeeds, it's a skin ID directory
-                
-                # Check if chroma directory exists
-                chroma_dir = skin_dir / str(chroma_id)
-                if chroma_dir.exists():
-                    found = _find_by_extensions(chroma_dir, str(chroma_id))
-                    if found:
-                        log_success(log, f"Found chroma: {found.name}", "")
-                        return found
-            except ValueError:
-                # Not a skin directory, skip
-                continue
+        # Try the chroma directory remembered from an earlier scan first
+        found = None
+        chroma_dir = self._chroma_dirs.get(champion_key, {}).get(chroma_name)
+        if chroma_dir is not None:
+            found = _find_by_extensions(Path(chroma_dir), chroma_name)
+        if found is None:
+            # Unknown or stale location: rescan the champion's skin directories
+            champion_dir = self.zips_dir / champion_key
+            index = self._index_chroma_dirs(champion_dir)
+            if index is None:
+                log.warning(f"[INJECT] Champion directory not found: {champion_dir}")
+                return None
+            self._chroma_dirs[champion_key] = index
+            chroma_dir = index.get(chroma_name)
+            found = _find_by_extensions(Path(chroma_dir), chroma_name) if chroma_dir else None
+        
+        if found:
+            log_success(log, f"Found chroma: {found.name}", "")
+            return found
         
         log.warning(f"[INJECT] Chroma {chroma_id} not found in any skin directory for champion {champion_id}")
         return None
     
+    @staticmethod
+    def _index_chroma_dirs(champion_dir: Path) -> Optional[Dict[str, str]]:
+        """Map chroma directory names to their paths across all skin directories
+        of a champion. Returns None if the champion directory does not exist."""
+        # scandir provides the directory type without an extra stat per entry
+        try:
+            with os.scandir(champion_dir) as entries:
+                skin_dirs = [
+                    entry.path for entry in entries
+                    if entry.name.isdecimal() and entry.is_dir()  # Skin ID directories only
+                ]
+        except FileNotFoundError:
+            return None
+        
+        index: Dict[str, str] = {}
+        for skin_dir in skin_dirs:
+            try:
+                with os.scandir(skin_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            index.setdefault(entry.name, entry.path)
+            except OSError:
+                continue
+        return index
+    
     def _resolve_elementalist_lux_form(self, chroma_id: int) -> Optional[Path]:
         """Resolve Elementalist Lux form by fake chroma ID"""
         log.info(f"[INJECT] Detected Elementalist Lux form fake ID: {chroma_id}")
@@ -11,21 +11,15 @@ Security Notes:
     - Commands only execute mod-tools.exe from the verified tools directory
 """
 
+import os
 import shutil
 import subprocess
+import sys
 import threading
 import time
 from pathlib import Path
 from typing import List, Optional, Callable
 
-# Import psutil with fallback for development environments
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
-    psutil = None
-
 from utils.core.logging import get_logger, log_action, log_success, log_event
 from utils.core.issue_reporter import report_issue
 from config import (
@@ -62,6 +56,8 @@ class OverlayManager:
         self.game_dir = game_dir
         self.process_manager = process_manager
         self.last_injection_timing = None
+        # mod-tools.exe path, resolved on first use once it is known to exist
+        self._modtools_exe: Optional[Path] = None
     
     @property
     def current_overlay_process(self):
@@ -74,6 +70,28 @@ class OverlayManager:
         if self.process_manager:
             self.process_manager.current_overlay_process = value
 
+    def _get_modtools_exe(self) -> Optional[Path]:
+        """Return the mod-tools.exe path, or None if it is missing.
+        The tools directory does not change at runtime, so a found path is reused."""
+        if self._modtools_exe is None:
+            from ..tools.tools_manager import ToolsManager
+            exe = ToolsManager(self.tools_dir).detect_tools().get("modtools")
+            if exe and exe.exists():
+                self._modtools_exe = exe
+        return self._modtools_exe
+
+    @staticmethod
+    def _creationflags(boost_priority: bool = False) -> int:
+        """Popen creation flags for mod-tools.exe.
+        The priority class is applied at process creation, which saves opening
+        the new process again just to raise its priority."""
+        if sys.platform != "win32":
+            return 0
+        creationflags = subprocess.CREATE_NO_WINDOW
+        if boost_priority:
+            creationflags |= subprocess.HIGH_PRIORITY_CLASS
+        return creationflags
+
     @staticmethod
     def _directory_size(directory: Path) -> int:
         '''Return the best-effort size of files below *directory*.'''
@@ -163,11 +181,8 @@ class OverlayManager:
             log.error("[INJECTOR] Please ensure League Client is running or manually set the path in config.ini")
             return 127
         
-        from ..tools.tools_manager import ToolsManager
-        tools_manager = ToolsManager(self.tools_dir)
-        tools = tools_manager.detect_tools()
-        exe = tools.get("modtools")
-        if not exe or not exe.exists():
+        exe = self._get_modtools_exe()
+        if exe is None:
             log.error(f"[INJECTOR] Missing mod-tools.exe in {self.tools_dir}")
             return 127
         
@@ -192,24 +207,12 @@ class OverlayManager:
         output_lines = []
         error_lines = []
         try:
-            # Hide console window on Windows
-            import sys
-            creationflags = 0
-            if sys.platform == "win32":
-                creationflags = subprocess.CREATE_NO_WINDOW
+            # Hide console window on Windows (and start boosted if enabled)
+            creationflags = self._creationflags(ENABLE_MKOVERLAY_PRIORITY_BOOST)
             
             # Capture both stdout and stderr - CSLOL uses logi() which may write to stdout
             proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, creationflags=creationflags, text=True, bufsize=1)
             
-            # Boost process priority to maximize CPU contention if enabled
-            if ENABLE_MKOVERLAY_PRIORITY_BOOST and PSUTIL_AVAILABLE:
-                try:
-                    p = psutil.Process(proc.pid)
-                    p.nice(psutil.HIGH_PRIORITY_CLASS)
-                    log.debug(f"[INJECT] Boosted mkoverlay process priority (PID={proc.pid})")
-                except Exception as e:
-                    log.debug(f"[INJECT] Could not boost process priority: {e}")
-            
             # Wait for process to complete with timeout
             # Read both stdout and stderr in separate threads to see what mkoverlay is doing
             def read_output(pipe, lines_list, prefix):
@@ -304,24 +307,12 @@ class OverlayManager:
         log.debug(f"[INJECT] Running overlay")
         
         try:
-            # Hide console window on Windows
-            import sys
-            creationflags = 0
-            if sys.platform == "win32":
-                creationflags = subprocess.CREATE_NO_WINDOW
+            # Hide console window on Windows (and start boosted if enabled)
+            creationflags = self._creationflags(ENABLE_RUNOVERLAY_PRIORITY_BOOST)
             
             # Don't capture stdout to avoid pipe buffer deadlock - send to devnull instead
             proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=creationflags)
             
-            # Boost process priority to maximize CPU contention if enabled
-            if ENABLE_RUNOVERLAY_PRIORITY_BOOST and PSUTIL_AVAILABLE:
-                try:
-                    p = psutil.Process(proc.pid)
-                    p.nice(psutil.HIGH_PRIORITY_CLASS)
-                    log.debug(f"[INJECT] Boosted runoverlay process priority (PID={proc.pid})")
-                except Exception as e:
-                    log.debug(f"[INJECT] Could not boost process priority: {e}")
-            
             if self.process_manager:
                 self.process_manager.current_overlay_process = proc
             
@@ -370,7 +361,6 @@ class OverlayManager:
     def _wipe_overlay_dir(overlay_dir: Path):
         """Delete overlay WAD files after runoverlay finishes"""
         try:
-            import shutil
             shutil.rmtree(overlay_dir, ignore_errors=True)
             overlay_dir.mkdir(parents=True, exist_ok=True)
             log.debug("[INJECT] Wiped overlay directory after game ended")
@@ -380,12 +370,16 @@ class OverlayManager:
     def _wipe_mods_dir(self):
         """Delete extracted skin files immediately after mkoverlay consumes them"""
         try:
-            import shutil
-            for p in self.mods_dir.iterdir():
-                if p.is_dir():
-                    shutil.rmtree(p, ignore_errors=True)
-                else:
-                    p.unlink(missing_ok=True)
+            # scandir entries carry the directory flag, no extra stat per entry
+            with os.scandir(self.mods_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                    else:
+                        try:
+                            os.unlink(entry.path)
+                        except FileNotFoundError:
+                            pass
             log.debug("[INJECT] Wiped mods directory after mkoverlay")
         except Exception as e:
             log.debug(f"[INJECT] Could not wipe mods directory: {e}")
@@ -491,15 +485,12 @@ class OverlayManager:
             # Copy overlay to the main overlay directory
             main_overlay_dir = self.mods_dir.parent / "overlay"
             
-            # Clean main overlay directory
-            if main_overlay_dir.exists():
-                import shutil
-                shutil.rmtree(main_overlay_dir, ignore_errors=True)
+            # Clean main overlay directory (rmtree tolerates a missing directory)
+            shutil.rmtree(main_overlay_dir, ignore_errors=True)
             main_overlay_dir.mkdir(parents=True, exist_ok=True)
             
             # Copy overlay contents
             log.debug(f"[INJECT] Copying from {overlay_path} to {main_overlay_dir}")
-            import shutil
             for item in overlay_path.iterdir():
                 if item.is_file():
                     shutil.copy2(item, main_overlay_dir / item.name)
@@ -513,11 +504,8 @@ class OverlayManager:
             log.debug(f"[INJECT] Main overlay directory contents: {[f.name for f in overlay_files]}")
             
             # Run overlay using runoverlay command
-            from ..tools.tools_manager import ToolsManager
-            tools_manager = ToolsManager(self.tools_dir)
-            tools = tools_manager.detect_tools()
-            exe = tools.get("modtools")
-            if not exe or not exe.exists():
+            exe = self._get_modtools_exe()
+            if exe is None:
                 log.error(f"[INJECTOR] Missing mod-tools.exe in {self.tools_dir}")
                 return False
             
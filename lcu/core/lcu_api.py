@@ -11,6 +11,14 @@ import threading
 import time
 import requests
 
+# Import orjson with fallback to requests' JSON decoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from config import LCU_GET_CACHE_TTL_S
 from utils.core.logging import get_logger
 
@@ -19,6 +27,22 @@ log = get_logger()
 _CACHE_MISS = object()
 
 
+def _decode_json(r: requests.Response) -> Any:
+    """Decode a response body as JSON. Returns None for empty or invalid bodies.
+
+    With orjson the raw bytes are parsed directly, skipping requests' charset
+    detection on ``r.text``."""
+    if not r.content:
+        return None
+    try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(r.content)
+        return r.json()
+    except ValueError as e:
+        log.debug(f"Failed to decode JSON response: {e}")
+        return None
+
+
 class LCUAPI:
     """Handles HTTP requests to LCU API"""
 
@@ -111,11 +135,7 @@ class LCUAPI:
             if r.status_code in (404, 405):
                 return _store(None)
             r.raise_for_status()
-            try:
-                return _store(r.json())
-            except (ValueError, requests.exceptions.JSONDecodeError) as e:
-                log.debug(f"Failed to decode JSON response: {e}")
-                return _store(None)
+            return _store(_decode_json(r))
         except requests.exceptions.RequestException:
             self.connection.refresh_if_needed(force=True)
             if not self.connection.ok:
@@ -125,10 +145,7 @@ class LCUAPI:
                 if r.status_code in (404, 405):
                     return _store(None)
                 r.raise_for_status()
-                try:
-                    return _store(r.json())
-                except Exception:
-                    return _store(None)
+                return _store(_decode_json(r))
             except requests.exceptions.RequestException:
                 return None
     
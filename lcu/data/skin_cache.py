@@ -5,7 +5,7 @@ Skin Cache
 Cache for champion skins scraped from LCU
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Tuple
 
 
 class ChampionSkinCache:
@@ -15,18 +15,32 @@ class ChampionSkinCache:
         self.champion_id = None
         self.champion_name = None
         self.skins = []  # List of {skinId, skinName, isBase, chromas, chromaDetails}
+        self.skin_names = []  # skinName of each entry in skins, same order (for batch matching)
         self.skin_id_map = {}  # skinId -> skin data
         self.skin_name_map = {}  # skinName -> skin data
         self.chroma_id_map = {}  # chromaId -> chroma data (for quick lookup)
+        self._skins_view = None  # Read-only snapshot of skins, rebuilt after changes
     
     def clear(self):
         """Clear the cache"""
         self.champion_id = None
         self.champion_name = None
         self.skins = []
+        self.skin_names = []
         self.skin_id_map = {}
         self.skin_name_map = {}
         self.chroma_id_map = {}
+        self._skins_view = None
+    
+    def add_skin(self, skin_data: Dict):
+        """Register a scraped skin in the list and the lookup maps.
+        All structures share the same dict, so each skin is stored once."""
+        skin_name = skin_data['skinName']
+        self.skins.append(skin_data)
+        self.skin_names.append(skin_name)
+        self.skin_id_map[skin_data['skinId']] = skin_data
+        self.skin_name_map[skin_name] = skin_data
+        self._skins_view = None
     
     def is_loaded_for_champion(self, champion_id: int) -> bool:
         """Check if cache is loaded for a specific champion"""
@@ -41,7 +55,10 @@ class ChampionSkinCache:
         return self.skin_name_map.get(skin_name)
     
     @property
-    def all_skins(self) -> List[Dict]:
-        """Get all skins for the cached champion"""
-        return self.skins.copy()
+    def all_skins(self) -> Tuple[Dict, ...]:
+        """Get all skins for the cached champion.
+        Returns a read-only tuple that is reused until the cache changes."""
+        if self._skins_view is None:
+            self._skins_view = tuple(self.skins)
+        return self._skins_view
 
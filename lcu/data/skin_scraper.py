@@ -4,15 +4,46 @@
 LCU Skin Scraper - Scrape skins for a specific champion from LCU
 """
 
-from typing import Optional, Dict, List, Tuple
+import re
+from typing import Optional, Dict, List, Sequence, Tuple
+
+# Import rapidfuzz with fallback to the pure-Python Levenshtein implementation
+try:
+    from rapidfuzz import process as fuzz_process
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+    fuzz_process = None
+    Levenshtein = None
 
 from config import LCU_SKIN_SCRAPER_TIMEOUT_S, SKIN_NAME_MIN_SIMILARITY
 from utils.core.logging import get_logger
+from utils.core.normalization import levenshtein_distance
 
 from .skin_cache import ChampionSkinCache
 
 log = get_logger()
 
+# Trailing chroma suffix appended by some locales (see find_skin_by_text)
+_CHROMA_SUFFIX_RE = re.compile(r"\s*(?:\([^)]*\)|–\s*'{0,2}[^']+'{0,2})\s*$")
+
+
+def _closest_name(text: str, names: Sequence[str]) -> Tuple[int, int]:
+    """Return (distance, index) of the name in `names` closest to `text`.
+    Ties go to the earliest name. `names` must not be empty."""
+    if RAPIDFUZZ_AVAILABLE:
+        # Scores every name in a single C call
+        _, distance, index = fuzz_process.extractOne(text, names, scorer=Levenshtein.distance)
+        return distance, index
+    
+    best_distance, best_index = None, 0
+    for index, name in enumerate(names):
+        distance = levenshtein_distance(text, name)
+        if best_distance is None or distance < best_distance:
+            best_distance, best_index = distance, index
+    return best_distance, best_index
+
 
 class LCUSkinScraper:
     """Scrape skins for a specific champion from LCU API"""
@@ -124,9 +155,7 @@ class LCUSkinScraper:
                 'num': skin.get('num', 0)
             }
             
-            self.cache.skins.append(skin_data)
-            self.cache.skin_id_map[skin_id] = skin_data
-            self.cache.skin_name_map[english_skin_name] = skin_data
+            self.cache.add_skin(skin_data)
         
         log.info(f"[LCU-SCRAPER] Scraped {len(self.cache.skins)} skins for {self.cache.champion_name} (ID: {champion_id})")
         
@@ -151,8 +180,6 @@ class LCUSkinScraper:
         if not text or not self.cache.skins:
             return None
 
-        from utils.core.normalization import levenshtein_distance
-
         # Build candidate input strings.  The League client sometimes appends
         # a chroma colour as a suffix whose format varies by locale:
         #   - Portuguese: "SkinName (Renegado)"       → trailing parentheses
@@ -161,9 +188,8 @@ class LCUSkinScraper:
         # use parentheses (e.g. prestige skins in Russian).  Instead, we try
         # both the original and a stripped variant and let the best similarity
         # score win.
-        import re
         candidates = [text]
-        stripped = re.sub(r"\s*(?:\([^)]*\)|–\s*'{0,2}[^']+'{0,2})\s*$", "", text)
+        stripped = _CHROMA_SUFFIX_RE.sub("", text)
         if stripped != text:
             candidates.append(stripped)
 
@@ -177,22 +203,20 @@ class LCUSkinScraper:
         if not use_levenshtein:
             return None
 
+        # Closest skin name over all candidates; ties go to the earlier skin,
+        # then to the earlier candidate
         best_match = None
-        best_distance = float('inf')
+        best_key = None
         best_similarity = 0.0
 
-        for skin in self.cache.skins:
-            skin_name = skin['skinName']
-
-            for candidate in candidates:
-                distance = levenshtein_distance(candidate, skin_name)
+        for candidate in candidates:
+            distance, index = _closest_name(candidate, self.cache.skin_names)
+            if best_key is None or (distance, index) < best_key:
+                skin_name = self.cache.skin_names[index]
                 max_len = max(len(candidate), len(skin_name))
-                similarity = 1.0 - (distance / max_len) if max_len > 0 else 0.0
-
-                if distance < best_distance:
-                    best_distance = distance
-                    best_similarity = similarity
-                    best_match = skin
+                best_key = (distance, index)
+                best_similarity = 1.0 - (distance / max_len) if max_len > 0 else 0.0
+                best_match = self.cache.skins[index]
 
         if best_match and best_similarity >= SKIN_NAME_MIN_SIMILARITY:
             return (best_match['skinId'], best_match['skinName'], best_similarity)
@@ -857,8 +857,9 @@ def run_league_unlock(args: Optional[argparse.Namespace] = None,
     
     # Wait for WebSocket status to be active before activating Pengu Loader
     log.info("Waiting for WebSocket status to be active before activating Pengu Loader...")
-    while not t_ws.connection.is_connected:
-        time.sleep(0.1)
+    # Wake as soon as the connection opens; the timeout only keeps the main thread interruptible
+    while not t_ws.connection.wait_until_connected(timeout=1.0):
+        pass
     
     log.info("WebSocket status is active, proceeding with Pengu Loader and injection system setup")
     
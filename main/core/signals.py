@@ -12,19 +12,84 @@ import utils.integration.pengu_loader as pengu_loader
 
 from .state import get_app_state
 
+WM_QUERYENDSESSION = 0x0011
+WM_ENDSESSION = 0x0016
+WM_QUIT = 0x0012
+PM_REMOVE = 0x0001
+QS_ALLINPUT = 0x04FF
+MWMO_INPUTAVAILABLE = 0x0004
+INFINITE = 0xFFFFFFFF
+WAIT_OBJECT_0 = 0x00000000
+
+# ctypes callbacks handed to Win32, kept alive for the lifetime of the process
+_PINNED_CALLBACKS: list = []
+
+# Win32 scaffolding for the shutdown watcher window, resolved once at import
+if sys.platform == "win32":
+    import ctypes
+    import threading
+    from ctypes import wintypes
+
+    _USER32 = ctypes.windll.user32
+    _KERNEL32 = ctypes.windll.kernel32
+
+    _POINTER_SIZE = ctypes.sizeof(ctypes.c_void_p)
+    LRESULT = (
+        getattr(wintypes, "LRESULT", None)
+        or (ctypes.c_longlong if _POINTER_SIZE == 8 else ctypes.c_long)
+    )
+    WPARAM = getattr(wintypes, "WPARAM", ctypes.c_ulonglong if _POINTER_SIZE == 8 else ctypes.c_ulong)
+    LPARAM = getattr(wintypes, "LPARAM", ctypes.c_longlong if _POINTER_SIZE == 8 else ctypes.c_long)
+
+    WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, WPARAM, LPARAM)
+
+    HCURSOR = getattr(wintypes, "HCURSOR", wintypes.HANDLE)
+    HICON = getattr(wintypes, "HICON", wintypes.HANDLE)
+    HBRUSH = getattr(wintypes, "HBRUSH", wintypes.HANDLE)
+
+    class WNDCLASSEXW(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.UINT),
+            ("style", wintypes.UINT),
+            ("lpfnWndProc", WNDPROC),
+            ("cbClsExtra", ctypes.c_int),
+            ("cbWndExtra", ctypes.c_int),
+            ("hInstance", wintypes.HINSTANCE),
+            ("hIcon", HICON),
+            ("hCursor", HCURSOR),
+            ("hbrBackground", HBRUSH),
+            ("lpszMenuName", wintypes.LPCWSTR),
+            ("lpszClassName", wintypes.LPCWSTR),
+            ("hIconSm", HICON),
+        ]
+
+    _USER32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, WPARAM, LPARAM]
+    _USER32.DefWindowProcW.restype = LRESULT
+    _USER32.MsgWaitForMultipleObjectsEx.argtypes = [
+        wintypes.DWORD,
+        ctypes.POINTER(wintypes.HANDLE),
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.DWORD,
+    ]
+    _USER32.MsgWaitForMultipleObjectsEx.restype = wintypes.DWORD
+    _KERNEL32.CreateEventW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+    _KERNEL32.CreateEventW.restype = wintypes.HANDLE
+    _KERNEL32.SetEvent.argtypes = [wintypes.HANDLE]
+    _KERNEL32.SetEvent.restype = wintypes.BOOL
+
 
 def signal_handler(signum, frame):
     """Handle system signals for graceful shutdown"""
-    app_state = get_app_state()
-    if app_state.shutting_down:
+    if not get_app_state().begin_shutdown():
         return  # Prevent multiple shutdown attempts
-    app_state.shutting_down = True
     
     print(f"\nReceived signal {signum}, initiating graceful shutdown...")
     try:
         pengu_loader.deactivate_on_exit()
     except Exception:
         pass
+    _stop_shutdown_watcher()
     # Let run_league_unlock() reach its finally block so the thread manager,
     # tray and injection processes are cleaned up as well.  The direct Pengu
     # deactivation above remains a safety net for signals received early in
@@ -34,19 +99,25 @@ def signal_handler(signum, frame):
 
 def force_quit_handler():
     """Force quit handler that can be called from anywhere"""
-    app_state = get_app_state()
-    if app_state.shutting_down:
+    if not get_app_state().begin_shutdown():
         return
-    app_state.shutting_down = True
     
     print("\nForce quit initiated...")
     try:
         pengu_loader.deactivate_on_exit()
     except Exception:
         pass
+    _stop_shutdown_watcher()
     os._exit(0)
 
 
+def _stop_shutdown_watcher() -> None:
+    """Signal the shutdown watcher thread to destroy its window and exit"""
+    stop_event = get_app_state().shutdown_watcher_event
+    if stop_event:
+        _KERNEL32.SetEvent(stop_event)
+
+
 def _start_shutdown_watcher() -> None:
     """Spawn a hidden top-level window that deactivates Pengu on WM_ENDSESSION.
 
@@ -56,52 +127,10 @@ def _start_shutdown_watcher() -> None:
     SetConsoleCtrlHandler is not guaranteed to fire.
 
     The window and its message pump live on a daemon thread so they don't
-    block normal shutdown through Python's exit machinery.
+    block normal shutdown through Python's exit machinery.  The pump waits on
+    a manual-reset event as well as the message queue, so
+    :func:`_stop_shutdown_watcher` can end the thread and release the window.
     """
-    import ctypes
-    from ctypes import wintypes
-    import threading
-
-    user32 = ctypes.windll.user32
-    kernel32 = ctypes.windll.kernel32
-
-    WM_QUERYENDSESSION = 0x0011
-    WM_ENDSESSION = 0x0016
-
-    # -- Minimal type scaffolding ------------------------------------------------
-    pointer_size = ctypes.sizeof(ctypes.c_void_p)
-    LRESULT = (
-        getattr(wintypes, "LRESULT", None)
-        or (ctypes.c_longlong if pointer_size == 8 else ctypes.c_long)
-    )
-    WPARAM = getattr(wintypes, "WPARAM", ctypes.c_ulonglong if pointer_size == 8 else ctypes.c_ulong)
-    LPARAM = getattr(wintypes, "LPARAM", ctypes.c_longlong if pointer_size == 8 else ctypes.c_long)
-
-    WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, WPARAM, LPARAM)
-
-    HCURSOR = getattr(wintypes, "HCURSOR", wintypes.HANDLE)
-    HICON = getattr(wintypes, "HICON", wintypes.HANDLE)
-    HBRUSH = getattr(wintypes, "HBRUSH", wintypes.HANDLE)
-
-    class WNDCLASSEXW(ctypes.Structure):
-        _fields_ = [
-            ("cbSize", wintypes.UINT),
-            ("style", wintypes.UINT),
-            ("lpfnWndProc", WNDPROC),
-            ("cbClsExtra", ctypes.c_int),
-            ("cbWndExtra", ctypes.c_int),
-            ("hInstance", wintypes.HINSTANCE),
-            ("hIcon", HICON),
-            ("hCursor", HCURSOR),
-            ("hbrBackground", HBRUSH),
-            ("lpszMenuName", wintypes.LPCWSTR),
-            ("lpszClassName", wintypes.LPCWSTR),
-            ("hIconSm", HICON),
-        ]
-
-    user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, WPARAM, LPARAM]
-    user32.DefWindowProcW.restype = LRESULT
-
     # -- Window procedure --------------------------------------------------------
     @WNDPROC
     def _wnd_proc(hwnd, msg, wparam, lparam):
@@ -109,23 +138,25 @@ def _start_shutdown_watcher() -> None:
             return 1  # agree to end the session
         if msg == WM_ENDSESSION:
             if wparam:  # session is actually ending
-                app_state = get_app_state()
-                if not app_state.shutting_down:
-                    app_state.shutting_down = True
+                if get_app_state().begin_shutdown():
                     try:
                         pengu_loader.deactivate_on_exit()
                     except Exception:
                         pass
             return 0
-        return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+        return _USER32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+    # The window class keeps a raw pointer to the thunk, which must never be freed
+    _PINNED_CALLBACKS.append(_wnd_proc)
 
-    # prevent GC of the callback
-    _start_shutdown_watcher._prevent_gc = _wnd_proc  # type: ignore[attr-defined]
+    # Manual-reset event that ends the message pump once signalled
+    stop_event = _KERNEL32.CreateEventW(None, True, False, None)
+    get_app_state().shutdown_watcher_event = stop_event
 
     # -- Thread body -------------------------------------------------------------
     def _run() -> None:
         class_name = "RoseShutdownWatcher"
-        h_instance = kernel32.GetModuleHandleW(None)
+        h_instance = _KERNEL32.GetModuleHandleW(None)
 
         wc = WNDCLASSEXW()
         wc.cbSize = ctypes.sizeof(WNDCLASSEXW)
@@ -133,12 +164,12 @@ def _start_shutdown_watcher() -> None:
         wc.hInstance = h_instance
         wc.lpszClassName = class_name
 
-        if not user32.RegisterClassExW(ctypes.byref(wc)):
+        if not _USER32.RegisterClassExW(ctypes.byref(wc)):
             return
 
         # Create a regular (non-message-only) top-level window so it receives
         # broadcast messages like WM_QUERYENDSESSION.  It is never shown.
-        hwnd = user32.CreateWindowExW(
+        hwnd = _USER32.CreateWindowExW(
             0,             # no extended style
             class_name,
             "Rose Shutdown Watcher",
@@ -152,10 +183,25 @@ def _start_shutdown_watcher() -> None:
         if not hwnd:
             return
 
+        handles = (wintypes.HANDLE * 1)(stop_event)
+        handle_count = 1 if stop_event else 0
         msg = wintypes.MSG()
-        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
-            user32.TranslateMessage(ctypes.byref(msg))
-            user32.DispatchMessageW(ctypes.byref(msg))
+        try:
+            while True:
+                result = _USER32.MsgWaitForMultipleObjectsEx(
+                    handle_count, handles, INFINITE, QS_ALLINPUT, MWMO_INPUTAVAILABLE
+                )
+                if result != WAIT_OBJECT_0 + handle_count:
+                    break  # stop event signalled or wait failed
+                # Sent messages (WM_QUERYENDSESSION / WM_ENDSESSION) are
+                # dispatched to _wnd_proc from within PeekMessageW
+                while _USER32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_REMOVE):
+                    if msg.message == WM_QUIT:
+                        return
+                    _USER32.TranslateMessage(ctypes.byref(msg))
+                    _USER32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            _USER32.DestroyWindow(hwnd)
 
     t = threading.Thread(target=_run, name="ShutdownWatcher", daemon=True)
     t.start()
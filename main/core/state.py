@@ -4,17 +4,31 @@
 Application state management
 """
 
+import threading
+
 
 class AppState:
     """Application state to replace global variables"""
     def __init__(self):
         self.shutting_down = False
+        self._shutdown_lock = threading.Lock()
         self.lock_file = None
         self.lock_file_path = None
 
         # NEW: keep the OS mutex handle alive for the lifetime of the process
         self.mutex_handle = None
 
+        # Win32 event handle that stops the shutdown watcher's message pump
+        self.shutdown_watcher_event = None
+
+    def begin_shutdown(self) -> bool:
+        """Mark the app as shutting down.
+        Returns True for exactly one caller; every later call returns False."""
+        if not self._shutdown_lock.acquire(blocking=False):
+            return False
+        self.shutting_down = True
+        return True
+
 
 # Global app state instance
 _app_state = AppState()
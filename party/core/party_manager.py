@@ -6,7 +6,10 @@ Orchestrator for party mode skin sharing via WebSocket relay.
 """
 
 import asyncio
+import hashlib
+import os
 import secrets
+import threading
 import time
 from typing import Callable, Dict, List, Optional, Tuple
 
@@ -24,7 +27,29 @@ from .party_state import PartyState
 log = get_logger()
 
 LOBBY_CHECK_INTERVAL = 2.0
-SKIN_BROADCAST_INTERVAL = 1.0
+SKIN_BROADCAST_INTERVAL = 1.0  # Minimum spacing between skin broadcasts
+SKIN_BROADCAST_RESYNC_INTERVAL = 10.0  # Re-check even without a change notification
+
+# Content hashes of mod files keyed by path, valid while (size, mtime_ns) match
+_content_hash_cache: Dict[str, Tuple[int, int, str]] = {}
+_content_hash_lock = threading.Lock()
+
+
+def _content_hash(path: str) -> str:
+    """Return the shortened SHA-256 of a file's content.
+    Files are only re-hashed after their size or mtime changes, so the
+    per-second skin broadcast does not re-read large mods."""
+    st = os.stat(path)
+    with _content_hash_lock:
+        cached = _content_hash_cache.get(path)
+    if cached is not None and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+        return cached[2]
+
+    with open(path, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()[:16]
+    with _content_hash_lock:
+        _content_hash_cache[path] = (st.st_size, st.st_mtime_ns, digest)
+    return digest
 
 
 class PartyManager:
@@ -48,12 +73,19 @@ class PartyManager:
 
         # Background tasks
         self._running = False
-        self._lobby_check_task: Optional[asyncio.Task] = None
+        self._lobby_check_handle: Optional[asyncio.TimerHandle] = None
+        self._prev_lobby_ids: frozenset = frozenset()
+        self._prev_peers_version = -1
         self._skin_broadcast_task: Optional[asyncio.Task] = None
+        # (selection key, relay payload) of the last skin we built for broadcast
+        self._my_skin_cache: Optional[Tuple[tuple, dict]] = None
+        self._skin_selection_changed: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Callbacks for UI updates
         self._on_state_change: Optional[Callable[[PartyState], None]] = None
         self._on_peer_update: Optional[Callable[[int, dict], None]] = None
+        self._notify_scheduled = False
 
     @property
     def enabled(self) -> bool:
@@ -115,7 +147,14 @@ class PartyManager:
 
             # Start background tasks
             self._running = True
-            self._lobby_check_task = asyncio.create_task(self._lobby_check_loop())
+            self._loop = asyncio.get_running_loop()
+            self._skin_selection_changed = asyncio.Event()
+            # Send a skin that is already hovered right away
+            self._skin_selection_changed.set()
+            self.state.skin_selection_listener = self._on_skin_selection_changed
+            self._prev_lobby_ids = frozenset()
+            self._prev_peers_version = -1
+            self._lobby_check_handle = self._loop.call_later(LOBBY_CHECK_INTERVAL, self._do_lobby_check)
             self._skin_broadcast_task = asyncio.create_task(self._skin_broadcast_loop())
 
             log.info(f"[PARTY] Party mode enabled. Token: {token_str[:20]}...")
@@ -131,23 +170,24 @@ class PartyManager:
         """Disable party mode."""
         log.info("[PARTY] Disabling party mode...")
         self._running = False
+        if self.state.skin_selection_listener == self._on_skin_selection_changed:
+            self.state.skin_selection_listener = None
 
-        for task in [self._lobby_check_task, self._skin_broadcast_task]:
-            if task:
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        if self._lobby_check_handle:
+            self._lobby_check_handle.cancel()
+            self._lobby_check_handle = None
 
-        self._lobby_check_task = None
-        self._skin_broadcast_task = None
+        if self._skin_broadcast_task:
+            self._skin_broadcast_task.cancel()
+            await asyncio.gather(self._skin_broadcast_task, return_exceptions=True)
+            self._skin_broadcast_task = None
 
         if self._relay:
             await self._relay.disconnect()
             self._relay = None
 
         self.party_state.clear_all()
+        self._my_skin_cache = None
         self._my_key = None
         self._my_token = None
 
@@ -221,13 +261,34 @@ class PartyManager:
         if not self.enabled or not self._relay or not self._relay.connected:
             return
 
+        skin_data = self._get_current_skin_payload()
+        if not skin_data:
+            return
+
+        await self._relay.send_skin(skin_data)
+
+    def _get_current_skin_payload(self) -> Optional[dict]:
+        """Return the relay payload for our current selection.
+        The payload is only rebuilt when the selection itself changes."""
+        selected_custom_mod = getattr(self.state, "selected_custom_mod", None)
+        key = (
+            self.party_state.my_summoner_id,
+            self.state.locked_champ_id or self.state.hovered_champ_id,
+            self.state.last_hovered_skin_id,
+            getattr(self.state, "selected_chroma_id", None),
+            selected_custom_mod.get("relative_path") if selected_custom_mod else None,
+        )
+        cached = self._my_skin_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         selection = self._skin_collector.get_my_selection(
             self.party_state.my_summoner_id,
             self.party_state.my_summoner_name,
         )
-
         if not selection:
-            return
+            self._my_skin_cache = None
+            return None
 
         skin_data = {
             "champion_id": selection.champion_id,
@@ -242,13 +303,18 @@ class PartyManager:
                 skin_data["custom_mod_hash"] = mod_hash
                 skin_data["is_custom"] = True
 
-        await self._relay.send_skin(skin_data)
+        self._my_skin_cache = (key, skin_data)
+        return skin_data
 
     def get_party_skins(self) -> List[PartySkinData]:
         """Get all skin selections for injection."""
         if not self.enabled or not self._lobby_matcher or not self._skin_collector:
             return []
 
+        # Nobody to collect from: skip the champ select session request
+        if not self.party_state.has_connected_peers():
+            return []
+
         team_champions = self._lobby_matcher.get_team_champion_mapping()
 
         # Collect skins from relay members
@@ -278,17 +344,18 @@ class PartyManager:
             name = member.get("summoner_name", "Unknown")
             skin = member.get("skin")
 
-            if sid not in self.party_state.peers:
+            if not self.party_state.batch_update(
+                sid,
+                summoner_name=name,
+                connected=True,
+                connection_state="connected",
+            ):
                 self.party_state.add_peer(
                     sid,
                     summoner_name=name,
                     connected=True,
                     connection_state="connected",
                 )
-            else:
-                self.party_state.peers[sid].summoner_name = name
-                self.party_state.peers[sid].connected = True
-                self.party_state.peers[sid].connection_state = "connected"
 
             # Update skin selection
             if skin and self._skin_collector:
@@ -317,29 +384,49 @@ class PartyManager:
 
     # ─── Background tasks ────────────────────────────────────────────────
 
-    async def _lobby_check_loop(self):
-        """Check lobby membership and update peer status."""
-        while self._running:
-            try:
-                await asyncio.sleep(LOBBY_CHECK_INTERVAL)
-                if not self._running or not self._lobby_matcher:
-                    continue
+    def _do_lobby_check(self):
+        """Check lobby membership and update peer status, then re-arm the timer."""
+        if not self._running:
+            return
+        try:
+            if self._lobby_matcher:
+                self._check_lobby()
+        except Exception as e:
+            log.info(f"[PARTY] Lobby check error: {e}")
+        if self._running:
+            self._lobby_check_handle = self._loop.call_later(LOBBY_CHECK_INTERVAL, self._do_lobby_check)
+
+    def _check_lobby(self):
+        """Sync each peer's in_lobby flag with the current lobby members."""
+        # Nothing to update unless the lobby or the peer set changed
+        lobby_ids = frozenset(self._lobby_matcher.get_all_summoner_ids())
+        peers_version = self.party_state.peers_version
+        prev_lobby_ids = self._prev_lobby_ids
+        if lobby_ids == prev_lobby_ids and peers_version == self._prev_peers_version:
+            return
 
-                lobby_ids = self._lobby_matcher.get_all_summoner_ids()
-                for sid in self.party_state.peers:
-                    in_lobby = sid in lobby_ids
-                    if self.party_state.peers[sid].in_lobby != in_lobby:
-                        self.party_state.update_peer_lobby_status(sid, in_lobby)
-                        name = self.party_state.peers[sid].summoner_name
-                        if in_lobby:
-                            log.info(f"[PARTY] Peer {name} joined our lobby")
-                        else:
-                            log.info(f"[PARTY] Peer {name} left our lobby")
+        peers = self.party_state.peers
+        if peers_version == self._prev_peers_version:
+            # Same peers: only those whose lobby membership flipped can change
+            candidates = peers.keys() & (lobby_ids ^ prev_lobby_ids)
+        else:
+            candidates = list(peers)
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                log.info(f"[PARTY] Lobby check error: {e}")
+        for sid in candidates:
+            peer = peers.get(sid)
+            if peer is None:
+                continue
+            in_lobby = sid in lobby_ids
+            if peer.in_lobby != in_lobby:
+                self.party_state.update_peer_lobby_status(sid, in_lobby)
+                name = peer.summoner_name
+                if in_lobby:
+                    log.info(f"[PARTY] Peer {name} joined our lobby")
+                else:
+                    log.info(f"[PARTY] Peer {name} left our lobby")
+
+        self._prev_lobby_ids = lobby_ids
+        self._prev_peers_version = peers_version
 
     async def _skin_broadcast_loop(self):
         """Broadcast skin updates when selection changes."""
@@ -349,7 +436,15 @@ class PartyManager:
 
         while self._running:
             try:
-                await asyncio.sleep(SKIN_BROADCAST_INTERVAL)
+                # Woken by SharedState assignments; the timeout is only a safety resync
+                try:
+                    await asyncio.wait_for(
+                        self._skin_selection_changed.wait(),
+                        timeout=SKIN_BROADCAST_RESYNC_INTERVAL,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._skin_selection_changed.clear()
                 if not self._running:
                     continue
 
@@ -366,29 +461,35 @@ class PartyManager:
                     last_chroma_id = current_chroma_id
                     last_custom_mod = custom_mod_key
                     await self.broadcast_skin_update()
+                    # Rate limit; changes made meanwhile leave the event set
+                    await asyncio.sleep(SKIN_BROADCAST_INTERVAL)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 log.info(f"[PARTY] Skin broadcast error: {e}")
 
+    def _on_skin_selection_changed(self):
+        """SharedState listener, may run on any thread"""
+        loop = self._loop
+        event = self._skin_selection_changed
+        if loop is None or event is None:
+            return
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            pass  # Event loop already closed
+
     @staticmethod
     def _hash_custom_mod(mod_path: str) -> Optional[str]:
         """Compute a content hash of a custom mod zip file."""
-        import hashlib
         from utils.core.paths import get_user_data_dir
 
         try:
             mods_root = get_user_data_dir() / "mods"
-            full_path = mods_root / mod_path
-            if not full_path.exists():
-                return None
-
-            h = hashlib.sha256()
-            with open(full_path, "rb") as f:
-                for chunk in iter(lambda: f.read(65536), b""):
-                    h.update(chunk)
-            return h.hexdigest()[:16]
+            return _content_hash(os.path.join(mods_root, mod_path))
+        except FileNotFoundError:
+            return None
         except Exception as e:
             log.debug(f"[PARTY] Failed to hash custom mod: {e}")
             return None
@@ -400,38 +501,46 @@ class PartyManager:
         Returns:
             Relative path to the matching mod (from mods root), or None.
         """
-        import hashlib
         from utils.core.paths import get_user_data_dir
 
         try:
             mods_root = get_user_data_dir() / "mods"
             skins_dir = mods_root / "skins"
-            if not skins_dir.exists():
-                return None
 
-            # Scan all mod zips
-            for skin_dir in skins_dir.iterdir():
-                if not skin_dir.is_dir():
-                    continue
-                for mod_file in skin_dir.iterdir():
-                    if not mod_file.is_file():
-                        continue
-                    if mod_file.suffix.lower() not in (".zip", ".fantome"):
-                        continue
+            # Scan all mod zips (hashes of unchanged files come from the cache)
+            with os.scandir(skins_dir) as skin_dirs:
+                skin_dir_entries = [entry for entry in skin_dirs if entry.is_dir()]
+            for skin_dir in skin_dir_entries:
+                with os.scandir(skin_dir.path) as mod_files:
+                    mod_file_entries = [
+                        entry for entry in mod_files
+                        if entry.name.lower().endswith((".zip", ".fantome")) and entry.is_file()
+                    ]
+                for mod_file in mod_file_entries:
                     try:
-                        h = hashlib.sha256()
-                        with open(mod_file, "rb") as f:
-                            for chunk in iter(lambda: f.read(65536), b""):
-                                h.update(chunk)
-                        if h.hexdigest()[:16] == content_hash:
-                            return str(mod_file.relative_to(mods_root))
+                        if _content_hash(mod_file.path) == content_hash:
+                            return os.path.join("skins", skin_dir.name, mod_file.name)
                     except Exception:
                         continue
+        except FileNotFoundError:
+            return None
         except Exception as e:
             log.debug(f"[PARTY] Error searching local mods: {e}")
 
         return None
 
     def _notify_state_change(self):
+        """Schedule the state-change callback, coalescing calls made in the same loop tick"""
+        if not self._on_state_change or self._notify_scheduled:
+            return
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self._do_notify()
+            return
+        self._notify_scheduled = True
+        loop.call_soon(self._do_notify)
+
+    def _do_notify(self):
+        self._notify_scheduled = False
         if self._on_state_change:
             self._on_state_change(self.party_state)
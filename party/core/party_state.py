@@ -12,7 +12,7 @@ from typing import Dict, List, Optional
 from ..protocol.message_types import SkinSelection
 
 
-@dataclass
+@dataclass(slots=True)
 class PartyPeerState:
     """State for a single party peer"""
     summoner_id: int
@@ -23,7 +23,7 @@ class PartyPeerState:
     skin_selection: Optional[SkinSelection] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PartyState:
     """Party mode state container"""
 
@@ -36,12 +36,47 @@ class PartyState:
     # Connected peers
     peers: Dict[int, PartyPeerState] = field(default_factory=dict)
 
-    # Skin selections from peers (champion_id -> skin_data)
-    party_skins: Dict[int, dict] = field(default_factory=dict)
-
     # Thread safety
     _lock: threading.Lock = field(default_factory=threading.Lock)
 
+    # Snapshot returned by to_dict(), rebuilt only after a change
+    _dict_dirty: bool = field(default=True, repr=False, compare=False)
+    _cached_dict: Optional[dict] = field(default=None, repr=False, compare=False)
+
+    # Bumped whenever peers are added or removed
+    _peers_version: int = field(default=0, repr=False, compare=False)
+
+    # Subset of peers that are connected, kept in sync by the mutators
+    _connected_peers: Dict[int, PartyPeerState] = field(default_factory=dict, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        # Public fields are also assigned directly (e.g. by PartyManager), so any
+        # such write invalidates the cached UI snapshot
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            object.__setattr__(self, "_dict_dirty", True)
+
+    @property
+    def party_skins(self) -> Dict[int, dict]:
+        """Skin selections from peers (champion_id -> skin_data), built on demand"""
+        with self._lock:
+            return {
+                p.skin_selection.champion_id: {
+                    "summoner_id": p.skin_selection.summoner_id,
+                    "summoner_name": p.skin_selection.summoner_name,
+                    "skin_id": p.skin_selection.skin_id,
+                    "chroma_id": p.skin_selection.chroma_id,
+                    "custom_mod_path": p.skin_selection.custom_mod_path,
+                }
+                for p in self.peers.values()
+                if p.skin_selection
+            }
+
+    @property
+    def peers_version(self) -> int:
+        """Counter that changes whenever the set of peers changes"""
+        return self._peers_version
+
     def add_peer(
         self,
         summoner_id: int,
@@ -62,59 +97,79 @@ class PartyState:
                     connected=connected,
                     connection_state=connection_state,
                 )
+                self._peers_version += 1
+            self._sync_connected(self.peers[summoner_id])
+            self._dict_dirty = True
 
     def remove_peer(self, summoner_id: int):
         """Remove a peer"""
         with self._lock:
             if summoner_id in self.peers:
                 del self.peers[summoner_id]
+                self._connected_peers.pop(summoner_id, None)
+                self._peers_version += 1
+                self._dict_dirty = True
+
+    def batch_update(self, summoner_id: int, **fields) -> bool:
+        """Update several fields of a peer under a single lock acquisition.
+
+        Returns False if the peer is unknown.
+        """
+        unknown = fields.keys() - PartyPeerState.__dataclass_fields__.keys()
+        if unknown:
+            raise AttributeError(f"Unknown peer fields: {sorted(unknown)}")
+        with self._lock:
+            peer = self.peers.get(summoner_id)
+            if peer is None:
+                return False
+            for name, value in fields.items():
+                setattr(peer, name, value)
+            if "connected" in fields:
+                self._sync_connected(peer)
+            self._dict_dirty = True
+            return True
+
+    def _sync_connected(self, peer: PartyPeerState):
+        """Mirror a peer's connected flag into _connected_peers (lock held)"""
+        if peer.connected:
+            self._connected_peers[peer.summoner_id] = peer
+        else:
+            self._connected_peers.pop(peer.summoner_id, None)
 
     def update_peer_connection(self, summoner_id: int, connected: bool):
         """Update peer connection status"""
-        with self._lock:
-            if summoner_id in self.peers:
-                self.peers[summoner_id].connected = connected
+        self.batch_update(summoner_id, connected=connected)
 
     def update_peer_connection_state(self, summoner_id: int, connection_state: str):
         """Update peer connection state (connecting, handshaking, connected, disconnected, dead)"""
-        with self._lock:
-            if summoner_id in self.peers:
-                self.peers[summoner_id].connection_state = connection_state
+        self.batch_update(summoner_id, connection_state=connection_state)
 
     def update_peer_lobby_status(self, summoner_id: int, in_lobby: bool):
         """Update peer lobby status"""
-        with self._lock:
-            if summoner_id in self.peers:
-                self.peers[summoner_id].in_lobby = in_lobby
+        self.batch_update(summoner_id, in_lobby=in_lobby)
 
     def update_peer_skin(self, summoner_id: int, selection: SkinSelection):
         """Update peer skin selection"""
         with self._lock:
             if summoner_id in self.peers:
                 self.peers[summoner_id].skin_selection = selection
-                # Also update party_skins for easy lookup by champion
-                self.party_skins[selection.champion_id] = {
-                    "summoner_id": selection.summoner_id,
-                    "summoner_name": selection.summoner_name,
-                    "skin_id": selection.skin_id,
-                    "chroma_id": selection.chroma_id,
-                    "custom_mod_path": selection.custom_mod_path,
-                }
+                self._dict_dirty = True
 
     def clear_peer_skin(self, summoner_id: int):
         """Clear peer skin selection"""
         with self._lock:
             if summoner_id in self.peers:
-                old_selection = self.peers[summoner_id].skin_selection
                 self.peers[summoner_id].skin_selection = None
-                # Remove from party_skins
-                if old_selection:
-                    self.party_skins.pop(old_selection.champion_id, None)
+                self._dict_dirty = True
 
     def get_connected_peers(self) -> List[PartyPeerState]:
         """Get list of connected peers"""
         with self._lock:
-            return [p for p in self.peers.values() if p.connected]
+            return list(self._connected_peers.values())
+
+    def has_connected_peers(self) -> bool:
+        """Check whether any peer is connected without building a list"""
+        return bool(self._connected_peers)
 
     def get_lobby_peers(self) -> List[PartyPeerState]:
         """Get list of peers in the current lobby"""
@@ -125,9 +180,9 @@ class PartyState:
         """Get all skin selections from peers (summoner_id -> selection)"""
         with self._lock:
             return {
-                p.summoner_id: p.skin_selection
-                for p in self.peers.values()
-                if p.connected and p.skin_selection
+                summoner_id: p.skin_selection
+                for summoner_id, p in self._connected_peers.items()
+                if p.skin_selection
             }
 
     def clear_all(self):
@@ -136,12 +191,22 @@ class PartyState:
             self.enabled = False
             self.my_token = None
             self.peers.clear()
-            self.party_skins.clear()
+            self._connected_peers.clear()
+            self._peers_version += 1
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for UI broadcast"""
+        """Convert to dictionary for UI broadcast.
+
+        The snapshot is cached until the state changes; callers get a shallow
+        copy and must not modify the nested peer entries.
+        """
         with self._lock:
-            return {
+            if not self._dict_dirty and self._cached_dict is not None:
+                return dict(self._cached_dict)
+            # Cleared before building so a concurrent unlocked field write
+            # marks the new snapshot stale again
+            self._dict_dirty = False
+            self._cached_dict = {
                 "enabled": self.enabled,
                 "my_token": self.my_token,
                 "my_summoner_id": self.my_summoner_id,
@@ -160,3 +225,4 @@ class PartyState:
                     for p in self.peers.values()
                 ],
             }
+            return dict(self._cached_dict)
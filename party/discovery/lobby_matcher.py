@@ -5,7 +5,9 @@ Lobby Matcher
 Matches connected peers to lobby/champion select members
 """
 
-from typing import Dict, List, Optional, Set
+import time
+from types import MappingProxyType
+from typing import AbstractSet, Dict, Iterable, List, Mapping, Optional
 
 from lcu import LCU
 from state import SharedState
@@ -15,6 +17,15 @@ from ..network.peer_connection import PeerConnection
 
 log = get_logger()
 
+LOBBY_IDS_STALE_GRACE_S = 5.0  # How long the last member set covers failed LCU reads
+
+_LOBBY_PHASES = frozenset({"Lobby", "Matchmaking", "ReadyCheck"})
+_SUMMONER_NAME_KEYS = ("displayName", "gameName", "internalName")  # In order of preference
+
+# Shared empty results for the common "not in a lobby / champ select" reads
+_EMPTY_IDS: AbstractSet[int] = frozenset()
+_EMPTY_CHAMP_MAP: Mapping[int, int] = MappingProxyType({})
+
 
 class LobbyMatcher:
     """Matches connected peers to current lobby members"""
@@ -29,66 +40,76 @@ class LobbyMatcher:
         self.lcu = lcu
         self.state = state
 
-    def get_lobby_summoner_ids(self) -> Set[int]:
+        # Last non-empty result of get_all_summoner_ids, with the phase and
+        # time it was read in
+        self._last_ids: AbstractSet[int] = _EMPTY_IDS
+        self._last_ids_phase: Optional[str] = None
+        self._last_ids_at = 0.0
+
+    def get_lobby_summoner_ids(self) -> AbstractSet[int]:
         """Get summoner IDs from current lobby
 
         Returns:
             Set of summoner IDs in the lobby
         """
-        summoner_ids = set()
-
-        try:
-            # Try lobby endpoint first (pre-game lobby)
-            lobby_data = self.lcu.get("/lol-lobby/v2/lobby")
-            if lobby_data and isinstance(lobby_data, dict):
-                members = lobby_data.get("members", [])
-                if isinstance(members, list):
-                    for member in members:
-                        if isinstance(member, dict):
-                            summoner_id = member.get("summonerId")
-                            if summoner_id:
-                                summoner_ids.add(int(summoner_id))
-
-                # Also check localMember
-                local_member = lobby_data.get("localMember")
-                if isinstance(local_member, dict):
-                    summoner_id = local_member.get("summonerId")
-                    if summoner_id:
-                        summoner_ids.add(int(summoner_id))
-
-        except Exception as e:
-            log.debug(f"[LOBBY] Error getting lobby members: {e}")
+        summoner_ids = self._read_lobby_ids()
+        return _EMPTY_IDS if summoner_ids is None else summoner_ids
 
-        return summoner_ids
-
-    def get_champ_select_summoner_ids(self) -> Set[int]:
+    def get_champ_select_summoner_ids(self) -> AbstractSet[int]:
         """Get summoner IDs from champion select
 
         Returns:
             Set of summoner IDs in champion select
         """
-        summoner_ids = set()
+        summoner_ids = self._read_champ_select_ids()
+        return _EMPTY_IDS if summoner_ids is None else summoner_ids
 
+    def _read_lobby_ids(self) -> Optional[AbstractSet[int]]:
+        """Read lobby member IDs, or None if the LCU read failed or returned nothing"""
+        try:
+            # The payload shape is checked once; malformed members fall
+            # through to the except below
+            lobby_data = self.lcu.get("/lol-lobby/v2/lobby")
+            if not isinstance(lobby_data, dict):
+                return None
+
+            summoner_ids = {
+                int(member["summonerId"])
+                for member in lobby_data.get("members") or ()
+                if member.get("summonerId")
+            }
+
+            # Also check localMember
+            local_member = lobby_data.get("localMember")
+            if local_member:
+                summoner_id = local_member.get("summonerId")
+                if summoner_id:
+                    summoner_ids.add(int(summoner_id))
+            return summoner_ids
+
+        except Exception as e:
+            log.debug(f"[LOBBY] Error getting lobby members: {e}")
+            return None
+
+    def _read_champ_select_ids(self) -> Optional[AbstractSet[int]]:
+        """Read champ select team IDs, or None if the LCU read failed or returned nothing"""
         try:
             session = self.lcu.session
-            if not session or not isinstance(session, dict):
-                return summoner_ids
+            if not isinstance(session, dict):
+                return None
 
             # Get myTeam members
-            my_team = session.get("myTeam", [])
-            if isinstance(my_team, list):
-                for player in my_team:
-                    if isinstance(player, dict):
-                        summoner_id = player.get("summonerId")
-                        if summoner_id:
-                            summoner_ids.add(int(summoner_id))
+            return {
+                int(player["summonerId"])
+                for player in session.get("myTeam") or ()
+                if player.get("summonerId")
+            }
 
         except Exception as e:
             log.debug(f"[LOBBY] Error getting champ select members: {e}")
+            return None
 
-        return summoner_ids
-
-    def get_all_summoner_ids(self) -> Set[int]:
+    def get_all_summoner_ids(self) -> AbstractSet[int]:
         """Get summoner IDs from lobby or champion select
 
         Returns:
@@ -96,16 +117,35 @@ class LobbyMatcher:
         """
         phase = self.state.phase
 
+        # None means the read failed, as opposed to an empty member list
         if phase == "ChampSelect":
-            return self.get_champ_select_summoner_ids()
-        elif phase in ("Lobby", "Matchmaking", "ReadyCheck"):
-            return self.get_lobby_summoner_ids()
+            ids = self._read_champ_select_ids()
+        elif phase in _LOBBY_PHASES:
+            ids = self._read_lobby_ids()
         else:
-            # Try both
-            ids = self.get_lobby_summoner_ids()
+            # Try both; only a failure of both counts as a failed read
+            ids = self._read_lobby_ids()
             if not ids:
-                ids = self.get_champ_select_summoner_ids()
-            return ids
+                champ_select_ids = self._read_champ_select_ids()
+                if champ_select_ids is not None or ids is None:
+                    ids = champ_select_ids
+
+        now = time.monotonic()
+        if ids:
+            self._last_ids = frozenset(ids)
+            self._last_ids_phase = phase
+            self._last_ids_at = now
+            return self._last_ids
+
+        # Keep the last members for a short grace period after a failed read
+        # in the same phase, so an LCU hiccup does not drop every peer
+        if (ids is None and self._last_ids and phase == self._last_ids_phase
+                and now - self._last_ids_at < LOBBY_IDS_STALE_GRACE_S):
+            log.debug("[LOBBY] Member read failed, serving last known members")
+            return self._last_ids
+
+        self._last_ids = _EMPTY_IDS
+        return _EMPTY_IDS
 
     def get_my_summoner_id(self) -> Optional[int]:
         """Get our own summoner ID
@@ -134,13 +174,10 @@ class LobbyMatcher:
             summoner = self.lcu.current_summoner
             if summoner and isinstance(summoner, dict):
                 # Try different name fields
-                name = summoner.get("displayName")
-                if not name:
-                    name = summoner.get("gameName")
-                if not name:
-                    name = summoner.get("internalName")
-                if name:
-                    return str(name)
+                for key in _SUMMONER_NAME_KEYS:
+                    name = summoner.get(key)
+                    if name:
+                        return str(name)
         except Exception as e:
             log.debug(f"[LOBBY] Error getting own summoner name: {e}")
 
@@ -163,54 +200,50 @@ class LobbyMatcher:
             log.debug("[LOBBY] No lobby members found")
             return {}
 
-        matched = {}
+        by_id = {peer.summoner_id: peer for peer in peers if peer.is_connected}
+        matched = {sid: by_id[sid] for sid in by_id.keys() & lobby_ids}
         for peer in peers:
-            if peer.is_connected and peer.summoner_id in lobby_ids:
-                matched[peer.summoner_id] = peer
-                peer.peer_info.in_lobby = True
-            else:
-                peer.peer_info.in_lobby = False
+            peer.peer_info.in_lobby = peer.is_connected and peer.summoner_id in matched
 
         if matched:
             log.info(f"[LOBBY] Matched {len(matched)} peers to lobby members")
 
         return matched
 
-    def get_team_champion_mapping(self) -> Dict[int, int]:
+    def get_team_champion_mapping(self) -> Mapping[int, int]:
         """Get mapping of summoner ID to champion ID for our team
 
         Returns:
-            Dict mapping summoner_id to champion_id
+            Read-only mapping of summoner_id to champion_id
         """
-        mapping = {}
+        mapping = _EMPTY_CHAMP_MAP
 
         try:
             session = self.lcu.session
-            if not session or not isinstance(session, dict):
+            if not isinstance(session, dict):
                 return mapping
 
-            my_team = session.get("myTeam", [])
-            if isinstance(my_team, list):
-                for player in my_team:
-                    if isinstance(player, dict):
-                        summoner_id = player.get("summonerId")
-                        champion_id = player.get("championId")
-                        if summoner_id and champion_id:
-                            mapping[int(summoner_id)] = int(champion_id)
+            mapping = {}
+            for player in session.get("myTeam") or ():
+                summoner_id = player.get("summonerId")
+                champion_id = player.get("championId")
+                if summoner_id and champion_id:
+                    mapping[int(summoner_id)] = int(champion_id)
 
         except Exception as e:
             log.debug(f"[LOBBY] Error getting team champions: {e}")
 
         return mapping
 
-    def is_in_same_lobby(self, peer_summoner_ids: List[int]) -> bool:
+    def is_in_same_lobby(self, peer_summoner_ids: Iterable[int]) -> bool:
         """Check if given peers are in our lobby
 
         Args:
-            peer_summoner_ids: List of peer summoner IDs to check
+            peer_summoner_ids: Peer summoner IDs to check
 
         Returns:
             True if at least one peer is in our lobby
         """
         lobby_ids = self.get_all_summoner_ids()
-        return bool(lobby_ids.intersection(peer_summoner_ids))
+        # Stops at the first shared ID without building the intersection
+        return bool(lobby_ids) and not lobby_ids.isdisjoint(peer_summoner_ids)
@@ -5,8 +5,10 @@ Skin Collector
 Collects and manages skin selections from party members
 """
 
+import threading
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 
 from state import SharedState
 from utils.core.logging import get_logger
@@ -17,7 +19,7 @@ from ..network.peer_connection import PeerConnection
 log = get_logger()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PartySkinData:
     """Aggregated skin data from party members"""
     summoner_id: int
@@ -40,8 +42,10 @@ class SkinCollector:
         """
         self.state = state
 
-        # Cached skin selections by summoner ID
+        # Cached skin selections by summoner ID; written from the party event
+        # loop and read from the injection thread
         self._selections: Dict[int, SkinSelection] = {}
+        self._lock = threading.Lock()
 
     def update_from_peer(self, selection: SkinSelection):
         """Update skin selection from peer
@@ -49,7 +53,8 @@ class SkinCollector:
         Args:
             selection: Peer's skin selection
         """
-        self._selections[selection.summoner_id] = selection
+        with self._lock:
+            self._selections[selection.summoner_id] = selection
         log.debug(
             f"[SKIN_COLLECT] Updated selection from {selection.summoner_name}: "
             f"champion {selection.champion_id} -> skin {selection.skin_id}"
@@ -61,13 +66,15 @@ class SkinCollector:
         Args:
             summoner_id: Peer's summoner ID to clear
         """
-        if summoner_id in self._selections:
-            del self._selections[summoner_id]
+        with self._lock:
+            removed = self._selections.pop(summoner_id, None)
+        if removed is not None:
             log.debug(f"[SKIN_COLLECT] Cleared selection for summoner {summoner_id}")
 
     def clear_all(self):
         """Clear all peer skin selections"""
-        self._selections.clear()
+        with self._lock:
+            self._selections.clear()
         log.debug("[SKIN_COLLECT] Cleared all peer selections")
 
     def get_my_selection(
@@ -139,6 +146,7 @@ class SkinCollector:
                     is_local=True,
                 )
             )
+        local_count = len(skins)
 
         # Add peer selections (require connected; in_lobby may be cleared at injection time when phase changes)
         for peer in peers:
@@ -174,8 +182,7 @@ class SkinCollector:
 
         log.info(
             f"[SKIN_COLLECT] Collected {len(skins)} skin selections "
-            f"({sum(1 for s in skins if s.is_local)} local, "
-            f"{sum(1 for s in skins if not s.is_local)} from peers)"
+            f"({local_count} local, {len(skins) - local_count} from peers)"
         )
 
         return skins
@@ -250,10 +257,11 @@ class SkinCollector:
         log.info(f"[SKIN_COLLECT] Collected {len(skins)} relay skin selections")
         return skins
 
-    def get_peer_selections(self) -> Dict[int, SkinSelection]:
+    def get_peer_selections(self) -> Mapping[int, SkinSelection]:
         """Get all cached peer selections
 
         Returns:
-            Dict mapping summoner_id to SkinSelection
+            Read-only live view mapping summoner_id to SkinSelection; copy it
+            before iterating from another thread
         """
-        return dict(self._selections)
+        return MappingProxyType(self._selections)
@@ -42,7 +42,7 @@ class PartyInjectionHook:
         return (
             self.party_manager is not None
             and self.party_manager.enabled
-            and len(self.party_manager.party_state.get_connected_peers()) > 0
+            and self.party_manager.party_state.has_connected_peers()
         )
 
     def get_party_skins_for_injection(self) -> List[PartySkinData]:
@@ -86,9 +86,17 @@ class PartyInjectionHook:
         if not party_skins:
             return []
 
+        # Peers with the same pick share one resolve/extract
+        unique_skins = {}
+        for skin_data in party_skins:
+            unique_skins.setdefault(
+                (skin_data.champion_id, skin_data.skin_id, skin_data.custom_mod_path),
+                skin_data,
+            )
+
         mod_folder_names = []
 
-        for skin_data in party_skins:
+        for skin_data in unique_skins.values():
             try:
                 mod_name = self._prepare_single_skin(
                     skin_data=skin_data,
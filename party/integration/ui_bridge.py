@@ -7,7 +7,16 @@ WebSocket communication bridge for party mode UI
 
 import asyncio
 import json
-from typing import Callable, Optional
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Import orjson with fallback to the standard json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 from utils.core.logging import get_logger
 
@@ -16,6 +25,14 @@ from ..core.party_state import PartyState
 
 log = get_logger()
 
+STATE_BROADCAST_DEBOUNCE_S = 0.05  # State changes within this window share one broadcast
+
+
+def _encode_message(message: dict) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message).decode("utf-8")
+    return json.dumps(message)
+
 
 class PartyUIBridge:
     """Handles WebSocket communication for party mode UI"""
@@ -29,6 +46,17 @@ class PartyUIBridge:
         """
         self.party_manager = party_manager
         self.broadcaster = broadcaster
+        self._broadcast_handle: Optional[asyncio.TimerHandle] = None
+
+        # Message type -> handler(data); handlers may be sync or async
+        self._handlers: Dict[str, Callable[[dict], Any]] = {
+            "party-enable": lambda data: self._handle_enable(),
+            "party-disable": lambda data: self._handle_disable(),
+            "party-add-peer": lambda data: self._handle_add_peer(data.get("token", "")),
+            "party-remove-peer": self._handle_remove_peer_message,
+            "party-get-state": lambda data: self._handle_get_state(),
+            "party-broadcast-skin": self._handle_broadcast_skin,
+        }
 
         # Register state change callback
         self.party_manager.set_callbacks(
@@ -44,31 +72,23 @@ class PartyUIBridge:
         Returns:
             Response dict or None
         """
-        msg_type = data.get("type", "")
-
-        if msg_type == "party-enable":
-            return await self._handle_enable()
-
-        elif msg_type == "party-disable":
-            return await self._handle_disable()
-
-        elif msg_type == "party-add-peer":
-            token = data.get("token", "")
-            return await self._handle_add_peer(token)
-
-        elif msg_type == "party-remove-peer":
-            summoner_id = data.get("summoner_id")
-            if summoner_id:
-                return await self._handle_remove_peer(int(summoner_id))
-
-        elif msg_type == "party-get-state":
-            return self._handle_get_state()
-
-        elif msg_type == "party-broadcast-skin":
-            await self.party_manager.broadcast_skin_update()
-            return {"type": "party-response", "success": True}
-
-        return None
+        handler = self._handlers.get(data.get("type", ""))
+        if handler is None:
+            return None
+        result = handler(data)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    async def _handle_remove_peer_message(self, data: dict) -> Optional[dict]:
+        summoner_id = data.get("summoner_id")
+        if not summoner_id:
+            return None
+        return await self._handle_remove_peer(int(summoner_id))
+
+    async def _handle_broadcast_skin(self, data: dict) -> dict:
+        await self.party_manager.broadcast_skin_update()
+        return {"type": "party-response", "success": True}
 
     async def _handle_enable(self) -> dict:
         """Handle party enable request"""
@@ -161,17 +181,29 @@ class PartyUIBridge:
         self._broadcast_state()
 
     def _broadcast_state(self):
-        """Broadcast current party state to all clients"""
+        """Broadcast current party state to all clients.
+        Calls made on the event loop are coalesced into one delayed broadcast."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._send_state()
+            return
+        if self._broadcast_handle is not None:
+            return  # A broadcast is already pending and will send the latest state
+        self._broadcast_handle = loop.call_later(STATE_BROADCAST_DEBOUNCE_S, self._send_state)
+
+    def _send_state(self):
+        self._broadcast_handle = None
         state = self.party_manager.get_state_dict()
         message = {
             "type": "party-state",
             **state,
-            "timestamp": __import__("time").time(),
+            "timestamp": time.time(),
         }
 
         if self.broadcaster:
             try:
-                self.broadcaster.broadcast_raw(json.dumps(message))
+                self.broadcaster.broadcast_raw(_encode_message(message))
             except Exception as e:
                 log.debug(f"[PARTY_UI] Failed to broadcast state: {e}")
 
@@ -187,10 +219,10 @@ def broadcast_party_state(broadcaster, party_manager: PartyManager):
         return
 
     state = party_manager.get_state_dict()
-    message = json.dumps({
+    message = _encode_message({
         "type": "party-state",
         **state,
-        "timestamp": __import__("time").time(),
+        "timestamp": time.time(),
     })
 
     try:
@@ -9,8 +9,9 @@ import asyncio
 import os
 import socket
 import struct
+import time
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from utils.core.logging import get_logger
 
@@ -27,6 +28,14 @@ STUN_ATTR_XOR_MAPPED_ADDRESS = 0x0020
 # STUN magic cookie (RFC 5389)
 STUN_MAGIC_COOKIE = 0x2112A442
 
+# STUN header: type (2) + length (2) + magic cookie (4), followed by the
+# transaction ID (12). Attributes start with type (2) + length (2).
+_HEADER = struct.Struct(">HHI")
+_ATTR_HEADER = struct.Struct(">HH")
+
+# A Binding Request with no attributes has length 0, so its header never changes
+_BINDING_REQUEST_HEADER = _HEADER.pack(STUN_BINDING_REQUEST, 0, STUN_MAGIC_COOKIE)
+
 # Public STUN servers
 STUN_SERVERS = [
     ("stun.l.google.com", 19302),
@@ -36,6 +45,9 @@ STUN_SERVERS = [
     ("stun.stunprotocol.org", 3478),
 ]
 
+STUN_RESOLVE_TTL_S = 300.0  # How long resolved STUN server addresses are reused
+LOCAL_IP_TTL_S = 60.0       # How long the detected LAN address is reused
+
 
 @dataclass
 class StunResult:
@@ -57,6 +69,45 @@ class StunClient:
         """
         self.timeout = timeout
 
+        # (host, sockaddr) for each STUN server that resolved, refreshed after STUN_RESOLVE_TTL_S
+        self._resolved: List[Tuple[str, Tuple[str, int]]] = []
+        self._resolved_at = 0.0
+
+        # Last detected LAN address, refreshed after LOCAL_IP_TTL_S
+        self._cached_local_ip: Optional[str] = None
+        self._cached_local_ip_at = 0.0
+
+    def invalidate_network_cache(self):
+        """Forget the cached LAN address and server addresses (e.g. after a network change)"""
+        self._cached_local_ip = None
+        self._resolved = []
+
+    async def _resolve_servers(self) -> List[Tuple[str, Tuple[str, int]]]:
+        """Resolve STUN_SERVERS to IPv4 addresses without blocking the event loop"""
+        now = time.monotonic()
+        if self._resolved and now - self._resolved_at < STUN_RESOLVE_TTL_S:
+            return self._resolved
+
+        loop = asyncio.get_running_loop()
+        addr_infos = await asyncio.gather(
+            *(
+                loop.getaddrinfo(host, port, family=socket.AF_INET, type=socket.SOCK_DGRAM)
+                for host, port in STUN_SERVERS
+            ),
+            return_exceptions=True,
+        )
+        resolved = []
+        for (host, _), addr_info in zip(STUN_SERVERS, addr_infos):
+            if isinstance(addr_info, BaseException) or not addr_info:
+                log.debug(f"[STUN] Failed to resolve {host}: {addr_info}")
+                continue
+            resolved.append((host, addr_info[0][4]))
+
+        if resolved:
+            self._resolved = resolved
+            self._resolved_at = now
+        return resolved
+
     def _create_binding_request(self) -> Tuple[bytes, bytes]:
         """Create a STUN Binding Request message
 
@@ -65,18 +116,7 @@ class StunClient:
         """
         # Generate random transaction ID (12 bytes)
         transaction_id = os.urandom(12)
-
-        # STUN header: type (2) + length (2) + magic cookie (4) + transaction ID (12)
-        # Binding Request with no attributes has length 0
-        header = struct.pack(
-            ">HHI",
-            STUN_BINDING_REQUEST,
-            0,  # Message length (no attributes)
-            STUN_MAGIC_COOKIE,
-        )
-
-        message = header + transaction_id
-        return message, transaction_id
+        return _BINDING_REQUEST_HEADER + transaction_id, transaction_id
 
     def _parse_binding_response(
         self, data: bytes, transaction_id: bytes
@@ -95,7 +135,7 @@ class StunClient:
             return None
 
         # Parse header
-        msg_type, msg_length, magic_cookie = struct.unpack(">HHI", data[:8])
+        msg_type, msg_length, magic_cookie = _HEADER.unpack_from(data)
         resp_transaction_id = data[8:20]
 
         # Verify message type
@@ -119,7 +159,7 @@ class StunClient:
             if offset + 4 > len(data):
                 break
 
-            attr_type, attr_length = struct.unpack(">HH", data[offset : offset + 4])
+            attr_type, attr_length = _ATTR_HEADER.unpack_from(data, offset)
             offset += 4
 
             if offset + attr_length > len(data):
@@ -154,24 +194,22 @@ class StunClient:
 
         # Format: reserved (1) + family (1) + port (2) + address (4 or 16)
         family = data[1]
-        xor_port = struct.unpack(">H", data[2:4])[0]
+        xor_port = int.from_bytes(data[2:4], "big")
 
         # XOR with magic cookie upper 16 bits
         port = xor_port ^ (STUN_MAGIC_COOKIE >> 16)
 
         if family == 0x01:  # IPv4
-            xor_addr = struct.unpack(">I", data[4:8])[0]
-            addr = xor_addr ^ STUN_MAGIC_COOKIE
-            ip = socket.inet_ntoa(struct.pack(">I", addr))
+            addr = int.from_bytes(data[4:8], "big") ^ STUN_MAGIC_COOKIE
+            ip = socket.inet_ntoa(addr.to_bytes(4, "big"))
             return ip, port
         elif family == 0x02:  # IPv6
             # IPv6 XOR with magic cookie + transaction ID
             if len(data) < 20:
                 return None
-            xor_addr = data[4:20]
-            magic_bytes = struct.pack(">I", STUN_MAGIC_COOKIE) + transaction_id
-            addr_bytes = bytes(a ^ b for a, b in zip(xor_addr, magic_bytes))
-            ip = socket.inet_ntop(socket.AF_INET6, addr_bytes)
+            mask = (STUN_MAGIC_COOKIE << 96) | int.from_bytes(transaction_id, "big")
+            addr = int.from_bytes(data[4:20], "big") ^ mask
+            ip = socket.inet_ntop(socket.AF_INET6, addr.to_bytes(16, "big"))
             return ip, port
 
         return None
@@ -182,7 +220,7 @@ class StunClient:
             return None
 
         family = data[1]
-        port = struct.unpack(">H", data[2:4])[0]
+        port = int.from_bytes(data[2:4], "big")
 
         if family == 0x01:  # IPv4
             ip = socket.inet_ntoa(data[4:8])
@@ -210,26 +248,38 @@ class StunClient:
                 return await self._discover_with_socket(local_socket)
 
             local_ip = self._get_local_ip()
-            for server_host, server_port in STUN_SERVERS:
-                try:
-                    result = await self._query_stun_server(
-                        None, server_host, server_port
-                    )
-                    if result:
-                        external_ip, external_port = result
-                        log.info(
-                            f"[STUN] Discovered external address: {external_ip}:{external_port} "
-                            f"(local: {local_ip}) via {server_host}"
-                        )
-                        return StunResult(
-                            external_ip=external_ip,
-                            external_port=external_port,
-                            local_ip=local_ip,
-                            local_port=0,
-                        )
-                except Exception as e:
-                    log.debug(f"[STUN] Failed to query {server_host}: {e}")
-                    continue
+
+            # Query every server at once and take the first usable answer
+            tasks = {
+                asyncio.create_task(self._query_stun_server(None, server_host, server_addr)): server_host
+                for server_host, server_addr in await self._resolve_servers()
+            }
+            pending = set(tasks)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        server_host = tasks[task]
+                        try:
+                            result = task.result()
+                        except Exception as e:
+                            log.debug(f"[STUN] Failed to query {server_host}: {e}")
+                            continue
+                        if result:
+                            external_ip, external_port = result
+                            log.info(
+                                f"[STUN] Discovered external address: {external_ip}:{external_port} "
+                                f"(local: {local_ip}) via {server_host}"
+                            )
+                            return StunResult(
+                                external_ip=external_ip,
+                                external_port=external_port,
+                                local_ip=local_ip,
+                                local_port=0,
+                            )
+            finally:
+                for task in pending:
+                    task.cancel()
 
             log.warning("[STUN] All STUN servers failed")
             return None
@@ -249,53 +299,66 @@ class StunClient:
             local_ip = self._get_local_ip()
             local_port = 0
 
-        for server_host, server_port in STUN_SERVERS:
+        # Send a request to every server up front, then match replies to
+        # servers by transaction ID as they arrive on the shared socket
+        pending_requests: Dict[bytes, str] = {}
+        for server_host, server_addr in await self._resolve_servers():
             try:
-                addr_info = socket.getaddrinfo(
-                    server_host, server_port, socket.AF_INET, socket.SOCK_DGRAM
-                )
-                if not addr_info:
-                    continue
-                server_addr = addr_info[0][4]
                 request, transaction_id = self._create_binding_request()
-
                 await loop.sock_sendto(sock, request, server_addr)
+                pending_requests[transaction_id] = server_host
+            except Exception as e:
+                log.info(f"[STUN] Failed to query {server_host}: {e}")
+
+        deadline = loop.time() + self.timeout
+        while pending_requests:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
                 data, _ = await asyncio.wait_for(
                     loop.sock_recvfrom(sock, 1024),
-                    timeout=self.timeout,
+                    timeout=remaining,
                 )
-                result = self._parse_binding_response(data, transaction_id)
-                if result:
-                    external_ip, external_port = result
-                    log.info(
-                        f"[STUN] Discovered external address: {external_ip}:{external_port} "
-                        f"(local: {local_ip}:{local_port}) via {server_host}"
-                    )
-                    return StunResult(
-                        external_ip=external_ip,
-                        external_port=external_port,
-                        local_ip=local_ip,
-                        local_port=local_port,
-                    )
             except asyncio.TimeoutError:
-                log.info(f"[STUN] Timeout waiting for response from {server_host}")
-                continue
-            except Exception as e:
-                log.info(f"[STUN] Failed to query {server_host}: {e}")
+                break
+            except OSError as e:
+                # e.g. ICMP port unreachable from one server, surfaced on the next recv
+                log.debug(f"[STUN] Receive error: {e}")
                 continue
 
+            transaction_id = data[8:20]
+            server_host = pending_requests.pop(transaction_id, None)
+            if server_host is None:
+                continue  # Not a reply to one of our requests
+            result = self._parse_binding_response(data, transaction_id)
+            if result:
+                external_ip, external_port = result
+                log.info(
+                    f"[STUN] Discovered external address: {external_ip}:{external_port} "
+                    f"(local: {local_ip}:{local_port}) via {server_host}"
+                )
+                return StunResult(
+                    external_ip=external_ip,
+                    external_port=external_port,
+                    local_ip=local_ip,
+                    local_port=local_port,
+                )
+
+        for server_host in pending_requests.values():
+            log.info(f"[STUN] Timeout waiting for response from {server_host}")
         log.warning("[STUN] All STUN servers failed (with socket)")
         return None
 
     async def _query_stun_server(
-        self, sock: socket.socket, host: str, port: int
+        self, sock: socket.socket, host: str, server_addr: Tuple[str, int]
     ) -> Optional[Tuple[str, int]]:
         """Query a single STUN server
 
         Args:
             sock: UDP socket to use
-            host: STUN server hostname
-            port: STUN server port
+            host: STUN server hostname (for logging)
+            server_addr: Resolved STUN server address
 
         Returns:
             Tuple of (external_ip, external_port) or None
@@ -305,12 +368,6 @@ class StunClient:
         # Run blocking STUN query in thread executor (more reliable on Windows)
         def blocking_query():
             try:
-                # Resolve hostname
-                addr_info = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_DGRAM)
-                if not addr_info:
-                    return None
-                server_addr = addr_info[0][4]
-
                 # Create request
                 request, transaction_id = self._create_binding_request()
 
@@ -347,10 +404,17 @@ class StunClient:
 
     def _get_local_ip(self) -> str:
         """Get local IP address (best guess for LAN IP)"""
+        now = time.monotonic()
+        if self._cached_local_ip and now - self._cached_local_ip_at < LOCAL_IP_TTL_S:
+            return self._cached_local_ip
         try:
             # Create a dummy connection to determine local IP
             with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
                 s.connect(("8.8.8.8", 80))
-                return s.getsockname()[0]
+                local_ip = s.getsockname()[0]
         except Exception:
+            # Not cached, so the next call tries again
             return "127.0.0.1"
+        self._cached_local_ip = local_ip
+        self._cached_local_ip_at = now
+        return local_ip
@@ -157,6 +157,13 @@ class UDPTransport:
             log.warning(f"[UDP] Send failed to {addr}: {e}")
             raise
 
+    def send_nowait(self, data: bytes, addr: Tuple[str, int]):
+        """Send a small UDP packet immediately without going through the loop.
+        The socket is non-blocking; a full send buffer raises BlockingIOError."""
+        if not self._socket:
+            raise RuntimeError("Transport not bound")
+        self._socket.sendto(data, addr)
+
     async def recv(self, timeout: float = 5.0) -> Tuple[bytes, Tuple[str, int]]:
         """Receive a UDP packet with timeout
 
@@ -309,7 +316,7 @@ class UDPTransport:
                 # Reply to PUNCH so hole punch succeeds (other side gets a response)
                 if data.startswith(b"PUNCH"):
                     try:
-                        await self.send(data, addr)
+                        self.send_nowait(data, addr)
                         log.debug(f"[UDP] Sent punch reply to {addr}")
                     except Exception as e:
                         log.debug(f"[UDP] Punch reply failed: {e}")
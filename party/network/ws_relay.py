@@ -14,6 +14,14 @@ from typing import Callable, Dict, List, Optional
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+# Import orjson with fallback to the standard json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from utils.core.logging import get_logger
 
 log = get_logger()
@@ -27,6 +35,19 @@ RELAY_URL = os.environ.get("ROSE_RELAY_URL", _CONFIGURED_URL)
 PING_INTERVAL = 25.0
 
 
+def _encode_message(message: dict) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message).decode("utf-8")
+    return json.dumps(message)
+
+
+def _decode_message(message: str):
+    """Parse a relay frame. Raises json.JSONDecodeError on malformed input."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
 def compute_room_key(host_summoner_id: int, host_key: bytes) -> str:
     """Derive a room key from the host's token."""
     raw = str(host_summoner_id).encode() + host_key
@@ -46,6 +67,8 @@ class PartyRelay:
         self._connected = False
         self._recv_task: Optional[asyncio.Task] = None
         self._ping_task: Optional[asyncio.Task] = None
+        # loop.time() of the last frame sent; any traffic postpones the next ping
+        self._last_send_at = 0.0
 
         # Current state: list of members with their skin picks
         self.members: List[dict] = []
@@ -76,6 +99,7 @@ class PartyRelay:
                 timeout=timeout,
             )
             self._connected = True
+            self._last_send_at = asyncio.get_running_loop().time()
             self._recv_task = asyncio.create_task(self._receive_loop())
             self._ping_task = asyncio.create_task(self._keepalive_loop())
             log.info("[RELAY] Connected")
@@ -103,20 +127,18 @@ class PartyRelay:
         """Leave the room."""
         self._connected = False
 
-        for task in [self._ping_task, self._recv_task]:
-            if task:
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        # Cancel both loops first, then wait for them together
+        tasks = [t for t in (self._ping_task, self._recv_task) if t]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
         self._ping_task = None
         self._recv_task = None
 
         if self._ws:
             try:
-                await self._ws.send(json.dumps({"type": "leave"}))
+                await self._ws.send(_encode_message({"type": "leave"}))
                 await self._ws.close()
             except Exception:
                 pass
@@ -128,7 +150,8 @@ class PartyRelay:
     async def _send_json(self, data: dict):
         if self._ws and self._connected:
             try:
-                await self._ws.send(json.dumps(data))
+                await self._ws.send(_encode_message(data))
+                self._last_send_at = asyncio.get_running_loop().time()
             except ConnectionClosed:
                 self._connected = False
 
@@ -139,7 +162,7 @@ class PartyRelay:
                     if message == "pong":
                         continue
                     try:
-                        msg = json.loads(message)
+                        msg = _decode_message(message)
                     except json.JSONDecodeError:
                         continue
 
@@ -161,13 +184,19 @@ class PartyRelay:
             self._connected = False
 
     async def _keepalive_loop(self):
+        """Ping only after PING_INTERVAL without any other outgoing frame."""
+        loop = asyncio.get_running_loop()
         try:
             while self._connected:
-                await asyncio.sleep(PING_INTERVAL)
+                delay = self._last_send_at + PING_INTERVAL - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
                 if self._ws and self._connected:
                     try:
                         await self._ws.send("ping")
                     except Exception:
                         break
+                    self._last_send_at = loop.time()
         except asyncio.CancelledError:
             return
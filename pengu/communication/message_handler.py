@@ -128,6 +128,49 @@ class MessageHandler:
         self.mod_storage = mod_storage or ModStorageService()
         self.injection_manager = injection_manager
 
+        # Message type -> handler, looked up once per incoming message
+        self._message_handlers = {
+            "chroma-log": self._handle_chroma_log,
+            "request-local-preview": self._handle_request_local_preview,
+            "request-local-asset": self._handle_request_local_asset,
+            "chroma-selection": self._handle_chroma_selection,
+            "dice-button-click": self._handle_dice_button_click,
+            "settings-request": self._handle_settings_request,
+            "path-validate": self._handle_path_validate,
+            "open-mods-folder": self._handle_open_mods_folder,
+            "request-skin-mods": self._handle_request_skin_mods,
+            "request-maps": self._handle_request_maps,
+            "request-fonts": self._handle_request_fonts,
+            "request-announcers": self._handle_request_announcers,
+            "request-category-mods": self._handle_request_category_mods,
+            "request-others": self._handle_request_others,
+            "select-skin-mod": self._handle_select_skin_mod,
+            "select-map": self._handle_select_map,
+            "select-font": self._handle_select_font,
+            "select-announcer": self._handle_select_announcer,
+            "select-other": self._handle_select_other,
+            "open-logs-folder": self._handle_open_logs_folder,
+            "diagnostics-request": self._handle_diagnostics_request,
+            "diagnostics-clear": self._handle_diagnostics_clear,
+            "diagnostics-clear-category": self._handle_diagnostics_clear_category,
+            "diagnostics-clear-tracker": self._handle_diagnostics_clear_tracker,
+            "diagnostics-apply-recommended": self._handle_diagnostics_apply_recommended,
+            "open-pengu-loader-ui": self._handle_open_pengu_loader_ui,
+            "settings-save": self._handle_settings_save,
+            "add-custom-mods-category-selected": self._handle_add_custom_mods_category_selected,
+            "add-custom-mods-champion-selected": self._handle_add_custom_mods_champion_selected,
+            "add-custom-mods-skin-selected": self._handle_add_custom_mods_skin_selected,
+            "find-match-hover": self._handle_find_match_hover,
+            "dismiss-custom-mod": self._handle_dismiss_custom_mod,
+            "dismiss-historic": self._handle_dismiss_historic,
+            # Party mode messages
+            "party-enable": self._handle_party_enable,
+            "party-disable": self._handle_party_disable,
+            "party-add-peer": self._handle_party_add_peer,
+            "party-remove-peer": self._handle_party_remove_peer,
+            "party-get-state": self._handle_party_get_state,
+        }
+
     def _is_valid_local_league_path(self, game_path: str) -> bool:
         """Validate a League install path without touching UNC/network paths."""
         if not isinstance(game_path, str):
@@ -165,88 +208,17 @@ class MessageHandler:
         payload_type = payload.get("type")
         
         # Route to appropriate handler
-        if payload_type == "chroma-log":
-            self._handle_chroma_log(payload)
-        elif payload_type == "request-local-preview":
-            self._handle_request_local_preview(payload)
-        elif payload_type == "request-local-asset":
-            self._handle_request_local_asset(payload)
-        elif payload_type == "chroma-selection":
-            self._handle_chroma_selection(payload)
-        elif payload_type == "dice-button-click":
-            self._handle_dice_button_click(payload)
-        elif payload_type == "settings-request":
-            self._handle_settings_request(payload)
-        elif payload_type == "path-validate":
-            self._handle_path_validate(payload)
-        elif payload_type == "open-mods-folder":
-            self._handle_open_mods_folder(payload)
-        elif payload_type == "request-skin-mods":
-            self._handle_request_skin_mods(payload)
-        elif payload_type == "request-maps":
-            self._handle_request_maps(payload)
-        elif payload_type == "request-fonts":
-            self._handle_request_fonts(payload)
-        elif payload_type == "request-announcers":
-            self._handle_request_announcers(payload)
-        elif payload_type == "request-category-mods":
-            self._handle_request_category_mods(payload)
-        elif payload_type == "request-others":
-            # Backwards compatible: treat as a request for the "others" category only
-            self._handle_request_category_mods({"category": self.mod_storage.CATEGORY_OTHERS})
-        elif payload_type == "select-skin-mod":
-            self._handle_select_skin_mod(payload)
-        elif payload_type == "select-map":
-            self._handle_select_map(payload)
-        elif payload_type == "select-font":
-            self._handle_select_font(payload)
-        elif payload_type == "select-announcer":
-            self._handle_select_announcer(payload)
-        elif payload_type == "select-other":
-            self._handle_select_other(payload)
-        elif payload_type == "open-logs-folder":
-            self._handle_open_logs_folder(payload)
-        elif payload_type == "diagnostics-request":
-            self._handle_diagnostics_request(payload)
-        elif payload_type == "diagnostics-clear":
-            self._handle_diagnostics_clear(payload)
-        elif payload_type == "diagnostics-clear-category":
-            self._handle_diagnostics_clear_category(payload)
-        elif payload_type == "diagnostics-clear-tracker":
-            self._handle_diagnostics_clear_tracker(payload)
-        elif payload_type == "diagnostics-apply-recommended":
-            self._handle_diagnostics_apply_recommended(payload)
-        elif payload_type == "open-pengu-loader-ui":
-            self._handle_open_pengu_loader_ui(payload)
-        elif payload_type == "settings-save":
-            self._handle_settings_save(payload)
-        elif payload_type == "add-custom-mods-category-selected":
-            self._handle_add_custom_mods_category_selected(payload)
-        elif payload_type == "add-custom-mods-champion-selected":
-            self._handle_add_custom_mods_champion_selected(payload)
-        elif payload_type == "add-custom-mods-skin-selected":
-            self._handle_add_custom_mods_skin_selected(payload)
-        elif payload_type == "find-match-hover":
-            self._handle_find_match_hover(payload)
-        elif payload_type == "dismiss-custom-mod":
-            self._handle_dismiss_custom_mod(payload)
-        elif payload_type == "dismiss-historic":
-            self._handle_dismiss_historic(payload)
-        # Party mode messages
-        elif payload_type == "party-enable":
-            self._handle_party_enable(payload)
-        elif payload_type == "party-disable":
-            self._handle_party_disable(payload)
-        elif payload_type == "party-add-peer":
-            self._handle_party_add_peer(payload)
-        elif payload_type == "party-remove-peer":
-            self._handle_party_remove_peer(payload)
-        elif payload_type == "party-get-state":
-            self._handle_party_get_state(payload)
+        handler = self._message_handlers.get(payload_type)
+        if handler is not None:
+            handler(payload)
         elif payload.get("skin"):
             # Handle skin detection message
             self._handle_skin_detection(payload)
     
+    def _handle_request_others(self, payload: dict) -> None:
+        """Backwards compatible: treat as a request for the "others" category only"""
+        self._handle_request_category_mods({"category": self.mod_storage.CATEGORY_OTHERS})
+    
     def _handle_chroma_log(self, payload: dict) -> None:
         """Handle chroma log message"""
         source = payload.get("source", "ChromaWheel")
@@ -9,6 +9,13 @@ import threading
 from dataclasses import dataclass, field
 from typing import Optional
 
+# Fields whose assignment notifies SharedState.skin_selection_listener
+_SKIN_SELECTION_FIELDS = frozenset({
+    "last_hovered_skin_id",
+    "selected_chroma_id",
+    "selected_custom_mod",
+})
+
 
 @dataclass
 class SharedState:
@@ -108,3 +115,11 @@ class SharedState:
     party_mode_enabled: bool = False
     party_token: Optional[str] = None  # Our party token for sharing
     party_manager = None  # Reference to PartyManager instance
+    skin_selection_listener = None  # Called from the assigning thread when the skin selection changes
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in _SKIN_SELECTION_FIELDS:
+            listener = self.skin_selection_listener
+            if listener is not None:
+                listener()
@@ -0,0 +1,88 @@
+import configparser
+import io
+import unittest
+
+from injection.config.config_manager import PATH_OPTIONS, ConfigManager
+
+
+def _parse_with_configparser(text):
+    config = configparser.ConfigParser()
+    config.read_string(text)
+    if 'General' not in config:
+        return {}
+    return {
+        option: value
+        for option, value in config['General'].items()
+        if option in PATH_OPTIONS
+    }
+
+
+class ScanPathOptionsTests(unittest.TestCase):
+    def assertMatchesConfigParser(self, text):
+        expected = _parse_with_configparser(text)
+        self.assertEqual(ConfigManager._scan_path_options(text), expected)
+        return expected
+
+    def test_file_written_by_configparser(self):
+        config = configparser.ConfigParser()
+        config.read_dict({
+            'General': {
+                'LeaguePath': r'C:\Riot Games\League of Legends\Game',
+                'ClientPath': r'C:\Riot Games\League of Legends',
+                'Theme': 'dark',
+            },
+            'Other': {'LeaguePath': r'D:\elsewhere'},
+        })
+        stream = io.StringIO()
+        config.write(stream)
+
+        expected = self.assertMatchesConfigParser(stream.getvalue())
+        self.assertEqual(expected['leaguepath'], r'C:\Riot Games\League of Legends\Game')
+
+    def test_colon_and_equals_delimiters_with_drive_paths(self):
+        text = (
+            '[General]\n'
+            'LeaguePath: C:\\Riot Games\\League of Legends\\Game\n'
+            'clientpath = D:\\Games\\Riot: Client\n'
+        )
+        expected = self.assertMatchesConfigParser(text)
+        self.assertEqual(expected['clientpath'], 'D:\\Games\\Riot: Client')
+
+    def test_comments_and_other_sections(self):
+        text = (
+            '# leaguepath = commented out\n'
+            '[Other]\n'
+            'leaguepath = C:\\wrong\n'
+            '[General]\n'
+            '; clientpath = commented out\n'
+            'leaguepath = C:\\League\\Game\n'
+            '\n'
+            '[Later]\n'
+            'clientpath = C:\\also wrong\n'
+        )
+        expected = self.assertMatchesConfigParser(text)
+        self.assertEqual(expected, {'leaguepath': 'C:\\League\\Game'})
+
+    def test_continuation_lines(self):
+        text = (
+            '[General]\n'
+            'leaguepath = C:\\League\n'
+            '    Game\n'
+            '\n'
+            '    Folder\n'
+            '\n'
+            'clientpath = C:\\Client\n'
+            '  # comment inside the value\n'
+            '  Riot\n'
+            'other = x\n'
+            '    not a path\n'
+        )
+        expected = self.assertMatchesConfigParser(text)
+        self.assertEqual(expected['leaguepath'], 'C:\\League\nGame\n\nFolder')
+
+    def test_missing_general_section(self):
+        self.assertMatchesConfigParser('[Other]\nleaguepath = C:\\League\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import utils.core.junction as junction
+
+
+class ExtractCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.cache_dir = self.root / 'cache'
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_archive(self, name, content):
+        archive = self.root / name
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr('data.txt', content)
+        return archive
+
+    def _extract(self, archive):
+        return junction._get_or_extract_to_cache(archive, archive.stem, self.cache_dir)
+
+    def test_unchanged_archive_is_extracted_once(self):
+        archive = self._write_archive('mod.zip', 'v1')
+
+        with patch.object(junction, 'safe_extractall', wraps=junction.safe_extractall) as extract:
+            first = self._extract(archive)
+            second = self._extract(archive)
+
+        self.assertEqual(first, second)
+        self.assertEqual(extract.call_count, 1)
+        self.assertEqual((first / 'data.txt').read_text(), 'v1')
+
+    def test_changed_archive_is_extracted_again(self):
+        archive = self._write_archive('mod.zip', 'v1')
+        first = self._extract(archive)
+
+        self._write_archive('mod.zip', 'version two')
+        second = self._extract(archive)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual((second / 'data.txt').read_text(), 'version two')
+        self.assertFalse(first.exists())
+
+    def test_fingerprint_sees_members_outside_the_head_and_tail(self):
+        def build(name, middle):
+            archive = self.root / name
+            with zipfile.ZipFile(archive, 'w', zipfile.ZIP_STORED) as zf:
+                for i in range(1500):
+                    data = middle if i == 400 else b'x' * 300
+                    zf.writestr(f'assets/member_{i:04d}.bin', data)
+            return archive
+
+        first = build('first.zip', b'a' * 300)
+        second = build('second.zip', b'b' * 300)
+
+        self.assertEqual(first.stat().st_size, second.stat().st_size)
+        self.assertNotEqual(junction.archive_fingerprint(first), junction.archive_fingerprint(second))
+
+        shutil.copyfile(first, self.root / 'copy.zip')
+        self.assertEqual(junction.archive_fingerprint(first), junction.archive_fingerprint(self.root / 'copy.zip'))
+
+    def test_copies_share_one_extraction_until_both_move_on(self):
+        original = self._write_archive('mod.zip', 'v1')
+        copy = self.root / 'copy.zip'
+        shutil.copyfile(original, copy)
+
+        shared = self._extract(original)
+        self.assertEqual(self._extract(copy), shared)
+
+        self._write_archive('mod.zip', 'version two')
+        self._extract(original)
+        self.assertTrue(shared.is_dir())
+
+        self._write_archive('copy.zip', 'version three')
+        self._extract(copy)
+        self.assertFalse(shared.exists())
+
+    def test_legacy_layout_is_removed(self):
+        archive = self._write_archive('mod.zip', 'v1')
+        legacy_dir = self.cache_dir / 'mod'
+        legacy_dir.mkdir(parents=True)
+        (legacy_dir / 'data.txt').write_text('old')
+        legacy_stamp = self.cache_dir / 'mod.mtime'
+        legacy_stamp.write_text('0')
+
+        cached = self._extract(archive)
+
+        self.assertEqual((cached / 'data.txt').read_text(), 'v1')
+        self.assertFalse(legacy_dir.exists())
+        self.assertFalse(legacy_stamp.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import tempfile
+import unittest
+import warnings
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import utils.core.safe_extract as safe_extract
+
+
+class SafeExtractTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_archive(self, entries):
+        archive = self.root / 'mod.zip'
+        with zipfile.ZipFile(archive, 'w') as zf:
+            for name, data in entries:
+                zf.writestr(name, data)
+        return archive
+
+    @staticmethod
+    def _snapshot(directory):
+        return {
+            path.relative_to(directory).as_posix(): path.read_bytes()
+            for path in directory.rglob('*')
+            if path.is_file()
+        }
+
+    def _extract(self, archive, name, threshold):
+        dest = self.root / name
+        with patch.object(safe_extract, 'PARALLEL_EXTRACT_THRESHOLD', threshold):
+            with patch.object(safe_extract, '_extract_parallel', wraps=safe_extract._extract_parallel) as parallel:
+                safe_extract.safe_extractall(archive, dest)
+        return dest, parallel.called
+
+    def test_parallel_path_matches_extractall(self):
+        entries = [(f'data/file{i}.bin', bytes([i]) * 64) for i in range(20)]
+        entries += [
+            ('data/nested/../lifted.txt', b'lifted'),
+            ('./data/dotted.txt', b'dotted'),
+            ('data//doubled.txt', b'doubled'),
+            ('odd:name.txt', b'colon'),
+            ('trailing. ', b'trailing'),
+            ('dup.txt', b'first'),
+            ('dup.txt', b'last'),
+        ]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)  # duplicate name
+            archive = self._write_archive(entries)
+
+        serial_dest, serial_parallel = self._extract(archive, 'serial', threshold=10_000)
+        parallel_dest, parallel_used = self._extract(archive, 'parallel', threshold=1)
+
+        self.assertFalse(serial_parallel)
+        self.assertTrue(parallel_used)
+        serial = self._snapshot(serial_dest)
+        self.assertEqual(serial, self._snapshot(parallel_dest))
+        self.assertEqual(serial['dup.txt'], b'last')
+        self.assertIn('data/nested/lifted.txt', serial)
+
+    def test_path_traversal_is_rejected(self):
+        archive = self._write_archive([('../escape.txt', b'x')])
+
+        with self.assertRaises(safe_extract.UnsafePathError):
+            safe_extract.safe_extractall(archive, self.root / 'out')
+        self.assertFalse((self.root / 'escape.txt').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
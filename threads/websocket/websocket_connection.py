@@ -73,10 +73,26 @@ class WebSocketConnection:
         self.app_status_callback = app_status_callback
         
         self.ws = None
-        self.is_connected = False
+        self._connected = threading.Event()
         self._stop_event = threading.Event()
         self._retry_attempt = 0
     
+    @property
+    def is_connected(self) -> bool:
+        return self._connected.is_set()
+    
+    @is_connected.setter
+    def is_connected(self, value: bool):
+        if value:
+            self._connected.set()
+        else:
+            self._connected.clear()
+    
+    def wait_until_connected(self, timeout: Optional[float] = None) -> bool:
+        """Block until the WebSocket is connected or timeout expires.
+        Returns True if connected."""
+        return self._connected.wait(timeout)
+    
     def run(self):
         """Main WebSocket connection loop"""
         if websocket is None:
@@ -12,11 +12,25 @@ Supports both:
 from __future__ import annotations
 
 import json
+import os
+import threading
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+# Import orjson with fallback to the standard json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 from utils.core.paths import get_user_data_dir
 
+# Validated file contents keyed by path, reused until the file's mtime changes
+_parsed_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+_parsed_cache_lock = threading.Lock()
+
 
 def _historic_file_path() -> Path:
     data_dir = get_user_data_dir()
@@ -28,26 +42,73 @@ def _historic_target_file_path() -> Path:
     return data_dir / "historic_targets.json"
 
 
+def _load_cached(p: Path, parse: Callable[[Any], Dict[str, Any]]) -> Dict[str, Any]:
+    """Return parse(<json in p>), re-reading the file only when its mtime changes.
+    Returns a fresh dict so callers may modify it. Missing files yield {}."""
+    try:
+        mtime_ns = os.stat(p).st_mtime_ns
+    except FileNotFoundError:
+        with _parsed_cache_lock:
+            _parsed_cache.pop(p, None)
+        return {}
+
+    with _parsed_cache_lock:
+        cached = _parsed_cache.get(p)
+    if cached is None or cached[0] != mtime_ns:
+        result = parse(_decode_json(p.read_bytes()))
+        cached = (mtime_ns, result)
+        with _parsed_cache_lock:
+            _parsed_cache[p] = cached
+    return dict(cached[1])
+
+
+def _decode_json(raw: bytes) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _encode_json(data: Dict[str, Any]) -> bytes:
+    """Serialize as UTF-8 JSON with two-space indentation (same layout either way)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _write_json(p: Path, data: Dict[str, Any]) -> None:
+    """Write data to p and drop its cached contents. Exceptions are propagated.
+    The file is written to a temporary sibling, synced, then renamed over p,
+    so an interrupted write never leaves a truncated file behind."""
+    with _parsed_cache_lock:
+        _parsed_cache.pop(p, None)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    temporary = p.with_name(f".{p.name}.tmp")
+    with open(temporary, "wb") as f:
+        f.write(_encode_json(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, p)
+
+
+def _parse_target_map(data: Any) -> Dict[str, int]:
+    if not isinstance(data, dict):
+        return {}
+
+    result: Dict[str, int] = {}
+    for key, value in data.items():
+        try:
+            target_id = int(value)
+            if target_id > 0:
+                result[str(int(key))] = target_id
+        except (TypeError, ValueError):
+            continue
+    return result
+
+
 def load_historic_target_map() -> Dict[str, int]:
     """Load the exact last skin/chroma target for custom history entries."""
     try:
-        p = _historic_target_file_path()
-        if not p.exists():
-            return {}
-        with p.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        if not isinstance(data, dict):
-            return {}
-
-        result: Dict[str, int] = {}
-        for key, value in data.items():
-            try:
-                target_id = int(value)
-                if target_id > 0:
-                    result[str(int(key))] = target_id
-            except (TypeError, ValueError):
-                continue
-        return result
+        return _load_cached(_historic_target_file_path(), _parse_target_map)
     except Exception:
         return {}
 
@@ -66,9 +127,7 @@ def write_historic_target(champion_id: int, target_skin_id: int) -> None:
         p = _historic_target_file_path()
         targets = load_historic_target_map()
         targets[str(int(champion_id))] = target_id
-        p.parent.mkdir(parents=True, exist_ok=True)
-        with p.open("w", encoding="utf-8") as f:
-            json.dump(targets, f, ensure_ascii=False, indent=2)
+        _write_json(p, targets)
     except Exception:
         pass
 
@@ -81,39 +140,38 @@ def clear_historic_target(champion_id: int) -> None:
         if str(int(champion_id)) not in targets:
             return
         targets.pop(str(int(champion_id)), None)
-        p.parent.mkdir(parents=True, exist_ok=True)
-        with p.open("w", encoding="utf-8") as f:
-            json.dump(targets, f, ensure_ascii=False, indent=2)
+        _write_json(p, targets)
     except Exception:
         pass
 
 
+def _parse_historic_map(data: Any) -> Dict[str, Union[int, str]]:
+    if not isinstance(data, dict):
+        return {}
+
+    result: Dict[str, Union[int, str]] = {}
+    for k, v in data.items():
+        try:
+            key = str(int(k))
+            # Keep value as-is: int for skin IDs, str for custom mod paths
+            if isinstance(v, int):
+                result[key] = int(v)
+            elif isinstance(v, str):
+                result[key] = str(v)
+        except Exception:
+            continue
+    return result
+
+
 def load_historic_map() -> Dict[str, Union[int, str]]:
     """Load the historic mapping. Returns empty dict if missing or invalid.
+    The parsed file is cached and only re-read when its mtime changes.
     
     Returns:
         Dict mapping champion IDs to either skin/chroma IDs (int) or custom mod paths (str with "path:" prefix)
     """
     try:
-        p = _historic_file_path()
-        if not p.exists():
-            return {}
-        with p.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        if isinstance(data, dict):
-            result: Dict[str, Union[int, str]] = {}
-            for k, v in data.items():
-                try:
-                    key = str(int(k))
-                    # Keep value as-is: int for skin IDs, str for custom mod paths
-                    if isinstance(v, int):
-                        result[key] = int(v)
-                    elif isinstance(v, str):
-                        result[key] = str(v)
-                except Exception:
-                    continue
-            return result
-        return {}
+        return _load_cached(_historic_file_path(), _parse_historic_map)
     except Exception:
         return {}
 
@@ -140,9 +198,7 @@ def write_historic_entry(champion_id: int, skin_or_chroma_id: Union[int, str]) -
     m = load_historic_map()
     m[str(int(champion_id))] = skin_or_chroma_id
     try:
-        p.parent.mkdir(parents=True, exist_ok=True)
-        with p.open("w", encoding="utf-8") as f:
-            json.dump(m, f, ensure_ascii=False, indent=2)
+        _write_json(p, m)
     except Exception:
         # Silently ignore write errors; feature is best-effort
         pass
@@ -156,9 +212,7 @@ def clear_historic_entry(champion_id: int) -> None:
         key = str(int(champion_id))
         if key in m:
             m.pop(key, None)
-            p.parent.mkdir(parents=True, exist_ok=True)
-            with p.open("w", encoding="utf-8") as f:
-                json.dump(m, f, ensure_ascii=False, indent=2)
+            _write_json(p, m)
     except Exception:
         # Best-effort; ignore errors
         pass
@@ -6,9 +6,15 @@ Provides directory junctions to avoid copying large mods on every injection.
 Falls back to shutil.copytree when junctions are unavailable.
 """
 
+import fnmatch
+import hashlib
 import os
 import shutil
 import stat
+import struct
+import tempfile
+import threading
+import uuid
 from pathlib import Path
 from typing import Union
 
@@ -17,6 +23,13 @@ from utils.core.safe_extract import safe_extractall
 
 log = get_logger()
 
+# Hidden siblings left behind by discard_tree and by extractions that never
+# finished (process exit mid-delete, locked files)
+_STALE_TREE_PATTERNS = (".*.evict-*", ".extract-*")
+_swept_parents: set = set()
+_active_extractions: set = set()
+_sweep_lock = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Detection
@@ -102,10 +115,137 @@ def safe_remove_entry(path: Union[str, Path]) -> None:
             pass
 
 
+def _remove_entries(paths: list) -> None:
+    for path in paths:
+        safe_remove_entry(path)
+
+
+def _sweep_stale_trees(parent: Path) -> None:
+    """Delete leftover evicted trees and unfinished extractions in *parent*.
+
+    Runs once per directory per process, on a daemon thread.  Extractions
+    still in progress in this process are skipped.
+    """
+    with _sweep_lock:
+        if parent in _swept_parents:
+            return
+        _swept_parents.add(parent)
+        stale = []
+        try:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    if entry.name in _active_extractions:
+                        continue
+                    if any(fnmatch.fnmatchcase(entry.name, pattern) for pattern in _STALE_TREE_PATTERNS):
+                        stale.append(entry.path)
+        except OSError:
+            return
+
+    if stale:
+        log.debug(f"[JUNCTION] Removing {len(stale)} stale tree(s) in {parent}")
+        threading.Thread(
+            target=_remove_entries,
+            args=(stale,),
+            name="SweepStaleTrees",
+            daemon=True,
+        ).start()
+
+
+def discard_tree(path: Union[str, Path]) -> None:
+    """Remove the directory tree at *path* without waiting for the delete.
+
+    The tree is first renamed to a hidden sibling, which frees *path*
+    immediately, and is then deleted on a daemon thread.  Falls back to
+    :func:`safe_remove_entry` for junctions or when the rename fails.
+    Siblings left by earlier, interrupted deletes are swept on first use.
+    """
+    path = Path(path)
+    _sweep_stale_trees(path.parent)
+    if is_junction(path):
+        safe_remove_entry(path)
+        return
+
+    doomed = path.with_name(f".{path.name}.evict-{uuid.uuid4().hex[:8]}")
+    try:
+        os.rename(path, doomed)
+    except FileNotFoundError:
+        return
+    except OSError:
+        safe_remove_entry(path)
+        return
+
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(doomed,),
+        kwargs={"ignore_errors": True},
+        name="DiscardTree",
+        daemon=True,
+    ).start()
+
+
 # ---------------------------------------------------------------------------
 # Cache helpers for ZIP / fantome archives
 # ---------------------------------------------------------------------------
 
+FINGERPRINT_CHUNK_SIZE = 64 * 1024
+
+# End of central directory record: signature, disk numbers, entry counts,
+# central directory size and offset, comment length (22 bytes)
+_EOCD = struct.Struct("<4s4H2LH")
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_EOCD_SEARCH_SIZE = _EOCD.size + 0xFFFF  # Record plus the longest comment
+
+
+def archive_fingerprint(zip_path: Path) -> str:
+    """Return a content fingerprint for *zip_path*.
+
+    Hashes the file size and the whole ZIP central directory, which holds
+    every member's name, CRC-32 and sizes, so any member change is seen
+    while the member data itself is never read.  Falls back to hashing the
+    full file when no plain (non-ZIP64) central directory is found.
+    Timestamps are left out so copies of one archive share a fingerprint.
+    """
+    size = os.stat(zip_path).st_size
+    digest = hashlib.sha256(str(size).encode())
+    with open(zip_path, "rb") as f:
+        tail_start = max(0, size - _EOCD_SEARCH_SIZE)
+        f.seek(tail_start)
+        tail = f.read()
+        eocd_at = tail.rfind(_EOCD_SIGNATURE)
+        directory_start = -1
+        if eocd_at >= 0 and len(tail) - eocd_at >= _EOCD.size:
+            fields = _EOCD.unpack_from(tail, eocd_at)
+            directory_size, directory_offset = fields[5], fields[6]
+            if directory_offset != 0xFFFFFFFF and directory_size != 0xFFFFFFFF:
+                directory_start = tail_start + eocd_at - directory_size
+
+        if directory_start >= 0:
+            f.seek(directory_start)
+        else:
+            f.seek(0)
+        while chunk := f.read(FINGERPRINT_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()[:32]
+
+
+def _release_cached_fingerprint(cache_dir: Path, fingerprint: str) -> None:
+    """Drop ``by_hash/<fingerprint>`` once no archive name points at it anymore."""
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".fingerprint"):
+                    continue
+                try:
+                    with open(entry.path) as f:
+                        if f.read().strip() == fingerprint:
+                            return
+                except OSError:
+                    continue
+    except OSError:
+        return
+    discard_tree(cache_dir / "by_hash" / fingerprint)
+
+
 def _get_or_extract_to_cache(
     zip_path: Path,
     folder_name: str,
@@ -113,44 +253,65 @@ def _get_or_extract_to_cache(
 ) -> Path:
     """Return a cached extraction of *zip_path* inside *cache_dir*.
 
-    The cache key is ``folder_name``.  The cached copy is invalidated when the
-    source file's ``mtime`` changes (e.g. the user replaces the ZIP with an
-    updated version).
+    Extractions live under ``by_hash/<fingerprint>`` (see
+    :func:`archive_fingerprint`), so an archive whose content is unchanged is
+    never extracted twice, and identical archives under different names share
+    one copy.  ``<folder_name>.fingerprint`` records which extraction each
+    archive name currently uses; when it moves on, the old extraction is
+    removed unless another name still refers to it.
     """
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    cached = cache_dir / folder_name
-
-    # Check mtime stamp file
-    stamp = cache_dir / f"{folder_name}.mtime"
-    try:
-        source_mtime = str(zip_path.stat().st_mtime)
-    except OSError:
-        source_mtime = ""
-
-    needs_extract = True
-    if cached.is_dir() and stamp.exists():
+    hash_dir = cache_dir / "by_hash"
+    hash_dir.mkdir(parents=True, exist_ok=True)
+    _sweep_stale_trees(hash_dir)
+
+    fingerprint = archive_fingerprint(zip_path)
+    cached = hash_dir / fingerprint
+    pointer = cache_dir / f"{folder_name}.fingerprint"
+
+    # Extractions are renamed into place once complete, so an existing
+    # directory is always a full copy
+    if cached.is_dir():
+        log.debug(f"[JUNCTION] Cache hit for {folder_name} ({fingerprint})")
+    else:
+        # Registered while created so a concurrent sweep never picks it up
+        with _sweep_lock:
+            temporary_dir = Path(tempfile.mkdtemp(prefix=".extract-", dir=hash_dir))
+            _active_extractions.add(temporary_dir.name)
         try:
-            stored_mtime = stamp.read_text().strip()
-            if stored_mtime == source_mtime:
-                needs_extract = False
-                log.debug(f"[JUNCTION] Cache hit for {folder_name}")
+            log.info(f"[JUNCTION] Extracting {zip_path.name} to cache: {cached}")
+            safe_extractall(zip_path, temporary_dir)
+            os.replace(temporary_dir, cached)
         except OSError:
-            pass
-
-    if needs_extract:
-        # Remove stale cache
-        if cached.exists() or is_junction(cached):
-            safe_remove_entry(cached)
-        cached.mkdir(parents=True, exist_ok=True)
-
-        log.info(f"[JUNCTION] Extracting {zip_path.name} to cache: {cached}")
-        safe_extractall(zip_path, cached)
+            if not cached.is_dir():
+                discard_tree(temporary_dir)
+                raise
+            # Another caller finished the same extraction first
+            discard_tree(temporary_dir)
+        except Exception:
+            discard_tree(temporary_dir)
+            raise
+        finally:
+            with _sweep_lock:
+                _active_extractions.discard(temporary_dir.name)
 
-        # Write mtime stamp
+    try:
+        previous = pointer.read_text().strip()
+    except OSError:
+        previous = None
+    if previous != fingerprint:
         try:
-            stamp.write_text(source_mtime)
+            pointer.write_text(fingerprint)
         except OSError:
             pass
+        if previous:
+            _release_cached_fingerprint(cache_dir, previous)
+        else:
+            # Extraction from the old name-keyed layout (mtime stamp beside it)
+            discard_tree(cache_dir / folder_name)
+            try:
+                os.unlink(cache_dir / f"{folder_name}.mtime")
+            except OSError:
+                pass
 
     return cached
 
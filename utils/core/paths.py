@@ -14,6 +14,20 @@ from typing import Optional, Tuple
 # Cache for the resolved user data directory
 _cached_user_data_dir: Optional[Path] = None
 
+# Win32 file attribute probing (single kernel transition per existence check)
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+
+if sys.platform == "win32":
+    import ctypes
+
+    # Private kernel32 handle so argtypes don't leak to other windll users
+    _GetFileAttributesW = ctypes.WinDLL("kernel32").GetFileAttributesW
+    _GetFileAttributesW.argtypes = [ctypes.c_wchar_p]
+    _GetFileAttributesW.restype = ctypes.c_uint32
+else:
+    _GetFileAttributesW = None
+
 
 def _get_desktop_user_info() -> Tuple[Optional[str], Optional[str]]:
     """
@@ -238,6 +252,29 @@ def get_injection_dir() -> Path:
     return injection_dir
 
 
+def file_exists(path) -> bool:
+    """
+    Check whether `path` exists and is a file.
+    On Windows this is a single GetFileAttributesW call instead of os.stat's
+    open/query/close sequence; elsewhere it falls back to os.path.isfile.
+    """
+    if _GetFileAttributesW is None:
+        return os.path.isfile(path)
+    attrs = _GetFileAttributesW(os.fspath(path))
+    return attrs != INVALID_FILE_ATTRIBUTES and not attrs & FILE_ATTRIBUTE_DIRECTORY
+
+
+def dir_exists(path) -> bool:
+    """
+    Check whether `path` exists and is a directory.
+    Windows counterpart of os.path.isdir using GetFileAttributesW.
+    """
+    if _GetFileAttributesW is None:
+        return os.path.isdir(path)
+    attrs = _GetFileAttributesW(os.fspath(path))
+    return attrs != INVALID_FILE_ATTRIBUTES and bool(attrs & FILE_ATTRIBUTE_DIRECTORY)
+
+
 def open_folder_in_explorer(folder: Path) -> None:
     """
     Create `folder` if missing and reveal it in the OS file explorer.